@@ -0,0 +1,40 @@
+"""Per-password cost of PasswordPolicy as constraints are added.
+
+Run from the repository root:  python benchmarks/bench_password_policy.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from password_policy import PasswordPolicy
+
+# --- Configuration ---
+COUNT = 20000
+LENGTHS = (8, 16, 32)
+
+CASES = [
+    ("pool only", dict(min_each=0)),
+    ("1 of each class", dict(min_each=1)),
+    ("2 of each class", dict(min_each=2)),
+    ("+ no ambiguous", dict(min_each=2, exclude_ambiguous=True)),
+    ("+ max run 2", dict(min_each=2, exclude_ambiguous=True, max_run=2)),
+    ("+ no repeats", dict(min_each=2, exclude_ambiguous=True, max_run=1)),
+]
+
+def bench(policy, count=COUNT):
+    """Returns microseconds per generated password."""
+    start = time.perf_counter()
+    for _ in range(count):
+        policy.generate()
+    return (time.perf_counter() - start) / count * 1e6
+
+def main():
+    print(f"{'constraints':<18}" + "".join(f"{f'len {n}':>12}" for n in LENGTHS) + "   (us/password)")
+    for name, options in CASES:
+        row = [bench(PasswordPolicy.from_options(length, **options)) for length in LENGTHS]
+        print(f"{name:<18}" + "".join(f"{us:12.2f}" for us in row))
+
+if __name__ == '__main__':
+    main()
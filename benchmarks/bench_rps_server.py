@@ -0,0 +1,90 @@
+"""Load test for the RPS match server.
+
+Connects CLIENTS simulated players (so CLIENTS / 2 concurrent matches),
+has each play ROUNDS rounds of random moves, and reports rounds per second
+plus the latency from sending MOVE to receiving RESULT. A round only
+resolves once both players have moved, so the latency includes waiting
+for the opponent's move to arrive.
+
+By default the server runs in a subprocess on a free port; pass
+--server host:port to load an already running one.
+
+Run from the repository root:  python benchmarks/bench_rps_server.py
+"""
+import argparse
+import asyncio
+import os
+import random
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from rps_client import MatchClient
+from rps_core import CHOICES
+
+# --- Configuration ---
+CLIENTS = 1000
+ROUNDS = 200
+
+async def player(host, port, index, rounds, latencies):
+    rng = random.Random(index)
+    client = await MatchClient(f"bot{index}").connect(host, port)
+    try:
+        await client.find_match()
+        for _ in range(rounds):
+            start = time.perf_counter()
+            if await client.play(rng.choice(CHOICES)) is None:
+                break
+            latencies.append(time.perf_counter() - start)
+    finally:
+        await client.close()
+
+async def load(host, port, clients, rounds):
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(player(host, port, i, rounds, latencies) for i in range(clients)))
+    return latencies, time.perf_counter() - start
+
+def start_server():
+    """Starts rps_server.py on a free port and returns (process, port)."""
+    process = subprocess.Popen([sys.executable, os.path.join(ROOT, "rps_server.py"), "--port", "0"],
+                               stderr=subprocess.PIPE, text=True)
+    banner = process.stderr.readline()  # "RPS server listening on host:port"
+    return process, int(banner.rsplit(":", 1)[1])
+
+def percentile(sorted_values, fraction):
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the RPS match server.")
+    parser.add_argument("-c", "--clients", type=int, default=CLIENTS, help="simulated players (even)")
+    parser.add_argument("-r", "--rounds", type=int, default=ROUNDS, help="rounds per match")
+    parser.add_argument("--server", help="host:port of a running server (default: start one)")
+    args = parser.parse_args()
+
+    process = None
+    if args.server:
+        host, port = args.server.rsplit(":", 1)
+        port = int(port)
+    else:
+        process, port = start_server()
+        host = "127.0.0.1"
+    try:
+        latencies, elapsed = asyncio.run(load(host, port, args.clients, args.rounds))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    # Each round produces one RESULT per player
+    rounds = len(latencies) // 2
+    latencies.sort()
+    print(f"{args.clients // 2} matches, {rounds:,} rounds in {elapsed:.2f} s: {rounds / elapsed:,.0f} rounds/s")
+    print(f"MOVE -> RESULT latency: p50 {percentile(latencies, 0.50) * 1e3:.2f} ms, "
+          f"p99 {percentile(latencies, 0.99) * 1e3:.2f} ms, max {latencies[-1] * 1e3:.2f} ms")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+"""Per-round decision cost of the adaptive RPS opponent as history grows.
+
+Plays MarkovStrategy against a biased random player for ROUNDS rounds and
+reports the average cost of one choose() + observe() step for each slice
+of the match. Flat numbers mean the cost doesn't grow with match length.
+
+Run from the repository root:  python benchmarks/bench_rps_strategy.py
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rps_core import WIN_CODE, resolve_code
+from rps_strategies import MarkovStrategy, RandomStrategy
+
+# --- Configuration ---
+ROUNDS = 1_200_000
+SLICES = 6
+
+def main():
+    rng = random.Random(42)
+    bot = MarkovStrategy()
+    user_moves = RandomStrategy((0.5, 0.3, 0.2)).moves(ROUNDS, rng)
+    per_slice = ROUNDS // SLICES
+    print(f"{'rounds played':>15} {'ns/round':>10} {'bot win rate':>14}")
+    for part in range(SLICES):
+        slice_wins = 0
+        start = time.perf_counter()
+        for i in range(part * per_slice, (part + 1) * per_slice):
+            user = user_moves[i]
+            move = bot.choose(rng)
+            bot.observe(move, user)
+            if resolve_code(move, user) == WIN_CODE:
+                slice_wins += 1
+        elapsed = time.perf_counter() - start
+        print(f"{(part + 1) * per_slice:>15,} {elapsed / per_slice * 1e9:>10.0f} {slice_wins / per_slice:>14.1%}")
+    print(f"history kept: {len(bot.history)} rounds (window {bot.window})")
+
+if __name__ == '__main__':
+    main()
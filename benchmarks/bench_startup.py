@@ -0,0 +1,51 @@
+"""Cold-import cost of the headless core modules versus the GUI modules.
+
+Every import runs in a fresh interpreter, so nothing is cached between
+measurements. The interpreter's own startup time is measured first and
+subtracted. GUI modules whose toolkit isn't installed are reported as
+skipped.
+
+Run from the repository root:  python benchmarks/bench_startup.py
+"""
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# --- Configuration ---
+REPEAT = 10
+
+HEADLESS = ["password_engine", "password_policy", "password_strength", "rps_core",
+            "task_store", "task_journal", "task_db"]
+GUI = ["password_generator", "rps_game", "todo_app"]
+
+def run(code):
+    """Returns the median wall time (ms) of `python -c code` over REPEAT runs, or None on error."""
+    times = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, "-c", code], cwd=ROOT,
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        times.append((time.perf_counter() - start) * 1000)
+        if result.returncode != 0:
+            return None
+    return statistics.median(times)
+
+def main():
+    baseline = run("pass")
+    print(f"interpreter startup: {baseline:.1f} ms (subtracted below)\n")
+    for title, modules in (("headless", HEADLESS), ("gui", GUI)):
+        print(f"{title}:")
+        for module in modules:
+            ms = run(f"import {module}")
+            if ms is None:
+                print(f"  {module:<20} skipped (import failed, toolkit not installed?)")
+            else:
+                print(f"  {module:<20} {ms - baseline:8.1f} ms")
+        print()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""Time the to-do handlers keep the UI thread busy, with and without the background writer.
+
+For each list size, replays a burst of add / mark-done / delete edits
+the way todo_app's handlers do (store update + persistence call) and
+reports the mean and worst time per edit. "sync" writes to the journal
+inline (one fsync per edit); "background" queues the records on a
+BackgroundWriter, which coalesces the burst into a few writes.
+
+Run from the repository root:  python benchmarks/bench_todo_handlers.py
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from task_journal import TaskJournal
+from task_store import TaskStore
+from task_writer import BackgroundWriter
+
+# --- Configuration ---
+SIZES = [1_000, 100_000, 1_000_000]
+EDITS = 300
+
+def run_edits(store, persist):
+    """Applies EDITS handler-style edits; returns the per-edit timings."""
+    timings = []
+    for i in range(EDITS):
+        start = time.perf_counter()
+        if i % 3 == 0:
+            task = store.add(f"benchmark task {i}")
+            persist([["add", task.text, task.created, task.id]])
+        elif i % 3 == 1:
+            index = len(store) - 1
+            store.mark_done(index)
+            persist([["done", index, store[index].updated, store[index].id]])
+        else:
+            index = len(store) // 2
+            task_id = store[index].id
+            store.delete(index)
+            persist([["del", index, task_id]])
+        timings.append(time.perf_counter() - start)
+    return timings
+
+def main():
+    print(f"{'tasks':>10} {'mode':>11} {'mean ms':>9} {'worst ms':>9} {'writes':>7}")
+    with tempfile.TemporaryDirectory() as directory:
+        for size in SIZES:
+            for mode in ("sync", "background"):
+                path = os.path.join(directory, f"tasks-{size}-{mode}.txt")
+                with open(path, "w", encoding="utf-8") as file:
+                    file.writelines(f"task {i}\n" for i in range(size))
+                journal = TaskJournal(path)
+                store = TaskStore()
+                for _ in journal.stream(store):
+                    pass
+                journal.pending_records()
+
+                if mode == "sync":
+                    timings = run_edits(store, journal.append)
+                    writes = EDITS
+                else:
+                    writer = BackgroundWriter(journal)
+                    timings = run_edits(store, writer.append)
+                    writer.close()
+                    writes = writer.writes
+                journal.close()
+                print(f"{size:>10,} {mode:>11} {sum(timings) / len(timings) * 1e3:>9.3f} "
+                      f"{max(timings) * 1e3:>9.3f} {writes:>7}")
+
+if __name__ == '__main__':
+    main()
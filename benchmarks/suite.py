@@ -0,0 +1,404 @@
+"""Benchmark suite for the hot paths of all three apps.
+
+Covers password generation throughput (engine and policy, several
+lengths and pools), RPS round resolution (the rules, batch scoring,
+history archiving and RPSGame.play_round) and task load/save cost as the
+task file grows (snapshot streaming, journal appends, SQLite, and the
+todo_app window's load and handlers).
+
+GUI cases run headless: Qt uses the "offscreen" platform and Tk needs a
+display (e.g. run the suite under xvfb-run). Cases whose toolkit or
+display is missing are reported as skipped.
+
+    python benchmarks/suite.py                      run everything
+    python benchmarks/suite.py -k tasks             only cases whose name contains "tasks"
+    python benchmarks/suite.py -o new.json          save results as JSON
+    python benchmarks/suite.py --compare old.json   flag cases that got slower (exit code 1)
+    python benchmarks/suite.py --profile cprofile   top functions per case
+    python benchmarks/suite.py --profile tracemalloc  peak memory per case
+
+The single-purpose scripts next to this file dig deeper into one
+question each (startup cost, policy constraints, strategy cost, server
+load, handler latency).
+"""
+import argparse
+import cProfile
+import datetime
+import io
+import json
+import os
+import platform
+import pstats
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# GUI cases render offscreen; must be set before PyQt5 is imported
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# --- Configuration ---
+REPEAT = 5  # Timed runs per case; the median is reported
+MIN_TIME = 0.05  # Seconds a timed run lasts at least (calls are repeated to get there)
+TASK_SIZES = [1_000, 10_000, 100_000]
+PASSWORD_LENGTHS = [8, 16, 32, 64]
+REGRESSION_THRESHOLD = 0.10  # --compare flags cases more than 10% slower
+PROFILE_TOP = 12  # Functions listed per case in cProfile mode
+GUI_LOAD_TIMEOUT = 120  # Seconds a GUI case waits for todo_app to finish loading
+
+CASES = []
+
+class Skip(Exception):
+    """Raised by a case's setup when it can't run here (missing toolkit or display)."""
+
+
+def case(name, ops=1):
+    """Registers a benchmark. The decorated function does the untimed setup and
+    returns (run, cleanup): `run()` is timed and does `ops` operations,
+    `cleanup` (or None) runs afterwards."""
+    def register(setup):
+        CASES.append((name, ops, setup))
+        return setup
+    return register
+
+# --- Passwords ---
+def _password_cases():
+    from password_engine import DIGITS, LOWERCASE, build_pool
+
+    pools = {"digits": DIGITS, "lower": LOWERCASE, "full": build_pool()}
+    for pool_name, pool in pools.items():
+        for length in PASSWORD_LENGTHS:
+            @case(f"password/generate_password/{pool_name}/len{length}")
+            def _(pool=pool, length=length):
+                from password_engine import generate_password
+                return (lambda: generate_password(length, pool)), None
+
+    for length in PASSWORD_LENGTHS:
+        @case(f"password/generate_block/full/len{length}", ops=1000)
+        def _(length=length):
+            from password_engine import ByteSampler, build_pool, generate_block
+            pool = build_pool()
+            sampler = ByteSampler(pool)
+            return (lambda: generate_block(1000, length, pool, sampler)), None
+
+    for length in PASSWORD_LENGTHS:
+        @case(f"password/policy/min_each1/len{length}")
+        def _(length=length):
+            from password_policy import PasswordPolicy
+            return PasswordPolicy.from_options(length, True, True, True, True, min_each=1).generate, None
+
+    @case("password/breach_lookup/300k", ops=2000)
+    def _():
+        from password_strength import BreachIndex
+        directory = tempfile.mkdtemp()
+        wordlist = os.path.join(directory, "breached.txt")
+        with open(wordlist, "w", encoding="utf-8") as file:
+            file.writelines(f"leaked{i}\n" for i in range(300_000))
+        index_path = os.path.join(directory, "breached.idx")
+        BreachIndex.build(wordlist, index_path)
+        index = BreachIndex(index_path)
+        # Half hits, half misses
+        queries = [f"leaked{i * 150}" for i in range(1000)] + [f"unseen{i}" for i in range(1000)]
+        def run():
+            for password in queries:
+                password in index
+        def cleanup():
+            index.close()
+            shutil.rmtree(directory)
+        return run, cleanup
+
+_password_cases()
+
+# --- Rock Paper Scissors ---
+@case("rps/resolve_round", ops=3000)
+def _():
+    from rps_core import CHOICES, resolve_round
+    rng = random.Random(1)
+    pairs = [(rng.choice(CHOICES), rng.choice(CHOICES)) for _ in range(3000)]
+    return (lambda: [resolve_round(a, b) for a, b in pairs]), None
+
+@case("rps/score_moves", ops=1_000_000)
+def _():
+    from rps_sim import score_moves
+    rng = random.Random(1)
+    a = bytes(rng.randrange(3) for _ in range(1_000_000))
+    b = bytes(rng.randrange(3) for _ in range(1_000_000))
+    return (lambda: score_moves(a, b)), None
+
+@case("rps/history_record", ops=1000)
+def _():
+    from rps_history import RoundHistory
+    directory = tempfile.mkdtemp()
+    history = RoundHistory(os.path.join(directory, "history.bin")).open()
+    def run():
+        for i in range(1000):
+            history.record(i % 3, (i // 3) % 3)
+    def cleanup():
+        history.close()
+        shutil.rmtree(directory)
+    return run, cleanup
+
+@case("rps/gui_play_round", ops=200)
+def _():
+    try:
+        from PyQt5.QtWidgets import QApplication
+    except ImportError:
+        raise Skip("PyQt5 not installed")
+    from rps_game import RPSGame
+    app = QApplication.instance() or QApplication([])
+    directory = tempfile.mkdtemp()
+    window = RPSGame(history_file=os.path.join(directory, "history.bin"))
+    def run():
+        for choice in ("Rock", "Paper", "Scissors") * 66 + ("Rock", "Paper"):
+            window.play_round(choice)
+        app.processEvents()
+    def cleanup():
+        window.close()
+        shutil.rmtree(directory)
+    return run, cleanup
+
+# --- Tasks ---
+def _write_tasks(path, count):
+    with open(path, "w", encoding="utf-8") as file:
+        file.writelines(f"task number {i}{' [DONE]' if i % 4 == 0 else ''}\n" for i in range(count))
+
+def _task_cases():
+    for size in TASK_SIZES:
+        @case(f"tasks/journal_load/{size}", ops=size)
+        def _(size=size):
+            from task_journal import TaskJournal
+            directory = tempfile.mkdtemp()
+            path = os.path.join(directory, "tasks.txt")
+            _write_tasks(path, size)
+            def run():
+                journal = TaskJournal(path)
+                journal.load()
+                journal.close()
+            return run, lambda: shutil.rmtree(directory)
+
+        @case(f"tasks/journal_append/{size}", ops=100)
+        def _(size=size):
+            from task_journal import TaskJournal
+            directory = tempfile.mkdtemp()
+            path = os.path.join(directory, "tasks.txt")
+            _write_tasks(path, size)
+            journal = TaskJournal(path)
+            store = journal.load()
+            def run():
+                for i in range(100):
+                    task = store.add(f"new task {i}")
+                    journal.append([["add", task.text, task.created, task.id]])
+            def cleanup():
+                journal.close()
+                shutil.rmtree(directory)
+            return run, cleanup
+
+        @case(f"tasks/sqlite_load/{size}", ops=size)
+        def _(size=size):
+            from task_db import TaskDatabase
+            directory = tempfile.mkdtemp()
+            text_path = os.path.join(directory, "tasks.txt")
+            _write_tasks(text_path, size)
+            db_path = os.path.join(directory, "tasks.db")
+            database = TaskDatabase(db_path, text_path=text_path)
+            database.open()  # Migrates the text file once, outside the timing
+            database.close()
+            def run():
+                database = TaskDatabase(db_path)
+                database.load()
+                database.close()
+            return run, lambda: shutil.rmtree(directory)
+
+        @case(f"tasks/gui_load/{size}", ops=size)
+        def _(size=size):
+            root, app, directory = _todo_window(size)
+            def run():
+                # Start over as if the app had just been launched on this file
+                app.store.clear()
+                app.task_view.clear()
+                app.index_tasks(app.search_index.clear)
+                app.storage.close()
+                app.storage = app.writer.storage = app.open_storage()
+                app.load_tasks()
+                _wait_loaded(root, app)
+            def cleanup():
+                app.on_close()
+                shutil.rmtree(directory)
+            return run, cleanup
+
+        @case(f"tasks/gui_add_task/{size}", ops=50)
+        def _(size=size):
+            root, app, directory = _todo_window(size)
+            def run():
+                for i in range(50):
+                    app.task_entry.insert(0, f"benchmark task {i}")
+                    app.add_task()
+                root.update()
+            def cleanup():
+                app.on_close()
+                shutil.rmtree(directory)
+            return run, cleanup
+
+def _todo_window(size):
+    """Opens todo_app's window on a fresh file of `size` tasks and waits for it to load."""
+    try:
+        import tkinter as tk
+        tk.Tk().destroy()
+    except Exception:
+        raise Skip("no Tk display (run under xvfb-run)")
+    import todo_app
+    directory = tempfile.mkdtemp()
+    todo_app.FILE_NAME = os.path.join(directory, "tasks.txt")
+    _write_tasks(todo_app.FILE_NAME, size)
+    todo_app.store.clear()
+    root = todo_app.build_window()
+    _wait_loaded(root, todo_app)
+    return root, todo_app, directory
+
+def _wait_loaded(root, app, timeout=GUI_LOAD_TIMEOUT):
+    """Runs the Tk loop until the to-do list has loaded (RuntimeError after `timeout` seconds)."""
+    deadline = time.monotonic() + timeout
+    while str(app.add_btn["state"]) != "normal":
+        if time.monotonic() > deadline:
+            raise RuntimeError(f"todo_app didn't finish loading within {timeout} s")
+        root.update()
+
+_task_cases()
+
+# --- Runner ---
+def measure(run, repeat=REPEAT, min_time=MIN_TIME):
+    """Returns (per-call times, calls per timed run) for `run`."""
+    start = time.perf_counter()
+    run()  # Warm-up; also sizes the batch
+    once = time.perf_counter() - start
+    calls = max(1, int(min_time / once)) if once > 0 else 1000
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(calls):
+            run()
+        times.append((time.perf_counter() - start) / calls)
+    return times, calls
+
+def profile_cpu(run, out):
+    profiler = cProfile.Profile()
+    profiler.enable()
+    run()
+    profiler.disable()
+    stream = io.StringIO()
+    pstats.Stats(profiler, stream=stream).sort_stats("cumulative").print_stats(PROFILE_TOP)
+    # Keep the table, drop pstats' preamble
+    table = stream.getvalue()
+    out.write(table[table.find("   ncalls"):].rstrip() + "\n\n")
+
+def profile_memory(run):
+    """Returns the peak traced allocation size in bytes while `run()` executes."""
+    tracemalloc.start()
+    try:
+        run()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def metadata():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                                text=True).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+    }
+
+def compare(results, baseline_path, threshold=REGRESSION_THRESHOLD, out=sys.stdout):
+    """Prints the change against a saved run; returns the names of cases that regressed."""
+    with open(baseline_path) as file:
+        baseline = {item["name"]: item for item in json.load(file)["results"]}
+    regressed = []
+    out.write(f"\n{'case':<48}{'before':>12}{'after':>12}{'change':>9}\n")
+    for item in results:
+        before = baseline.get(item["name"])
+        if before is None or "median_s" not in before or "median_s" not in item:
+            continue
+        change = item["median_s"] / before["median_s"] - 1
+        flag = "  <-- slower" if change > threshold else ""
+        if flag:
+            regressed.append(item["name"])
+        out.write(f"{item['name']:<48}{_fmt(before['median_s'] / before['ops'])}"
+                  f"{_fmt(item['median_s'] / item['ops'])}{change:>+9.1%}{flag}\n")
+    return regressed
+
+def _fmt(seconds):
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:>9.2f} {unit:<2}"
+    return f"{seconds / 1e-9:>9.1f} ns"
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the hot paths of the password, RPS and to-do apps.")
+    parser.add_argument("-k", "--filter", default="", help="only run cases whose name contains this text")
+    parser.add_argument("-o", "--output", help="save the results as JSON")
+    parser.add_argument("--compare", help="JSON from an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD,
+                        help="slowdown --compare reports as a regression (0.1 = 10%%)")
+    parser.add_argument("--repeat", type=int, default=REPEAT, help="timed runs per case")
+    parser.add_argument("--profile", choices=["cprofile", "tracemalloc"],
+                        help="also profile one run of each case (per-function time or peak memory)")
+    parser.add_argument("--list", action="store_true", help="list the cases and exit")
+    args = parser.parse_args(argv)
+
+    selected = [entry for entry in CASES if args.filter in entry[0]]
+    if args.list:
+        for name, _, _ in selected:
+            print(name)
+        return 0
+
+    results = []
+    print(f"{'case':<48}{'per op':>12}{'ops/s':>14}")
+    for name, ops, setup in selected:
+        try:
+            run, cleanup = setup()
+        except Skip as reason:
+            print(f"{name:<48}{'skipped':>12}  ({reason})")
+            results.append({"name": name, "skipped": str(reason)})
+            continue
+        try:
+            times, calls = measure(run, args.repeat)
+            median = statistics.median(times)
+            item = {"name": name, "ops": ops, "calls_per_run": calls, "median_s": median,
+                    "min_s": min(times), "stdev_s": statistics.stdev(times) if len(times) > 1 else 0.0,
+                    "ops_per_s": ops / median}
+            line = f"{name:<48}{_fmt(median / ops)}{ops / median:>14,.0f}"
+            if args.profile == "tracemalloc":
+                item["peak_bytes"] = profile_memory(run)
+                line += f"   peak {item['peak_bytes'] / 1024:,.0f} KiB"
+            print(line)
+            if args.profile == "cprofile":
+                profile_cpu(run, sys.stdout)
+            results.append(item)
+        finally:
+            if cleanup is not None:
+                cleanup()
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({"meta": metadata(), "results": results}, file, indent=2)
+    if args.compare:
+        regressed = compare(results, args.compare, args.threshold)
+        if regressed:
+            print(f"\n{len(regressed)} case(s) more than {args.threshold:.0%} slower", file=sys.stderr)
+            return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,248 @@
+"""Opt-in latency metrics for the apps' GUI event handlers.
+
+Set APP_METRICS to a file path to turn it on, e.g.
+
+    APP_METRICS=metrics.prom python launcher.py todo    Prometheus text format
+    APP_METRICS=metrics.json python launcher.py rps     JSON
+
+Then each decorated handler records a call count and a latency histogram,
+and a timer on the event loop records stalls: how late it fired, which
+is how long the loop was blocked. The file is rewritten every
+DUMP_INTERVAL seconds and at exit.
+
+`timed(name)` records a block inside a handler the same way, e.g. the
+work a handler does on the GUI thread without the dialogs it shows.
+
+With APP_METRICS unset, `instrument()` returns the handler itself, `timed()`
+returns a shared no-op context manager and the watch functions do nothing,
+so there is next to no overhead. Handlers and timers all run on the GUI
+thread, so the counters are plain integers with no locks; the file is
+written from a separate thread, which only reads them (a dump may be a
+call or two out of date). APP_METRICS_SAMPLE=N times only every Nth call
+of a handler (calls are still all counted).
+"""
+import atexit
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+
+# --- Configuration ---
+PATH = os.environ.get("APP_METRICS")
+ENABLED = bool(PATH)
+SAMPLE_EVERY = max(1, int(os.environ.get("APP_METRICS_SAMPLE", "1")))
+STALL_INTERVAL = 0.05  # Seconds between event loop heartbeats
+STALL_THRESHOLD = float(os.environ.get("APP_METRICS_STALL_MS", "50")) / 1000  # Lateness counted as a stall
+DUMP_INTERVAL = 10.0  # Seconds between rewrites of the metrics file
+
+# Histogram bucket upper bounds in seconds (a final +Inf bucket is implied)
+BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+# --- Metrics ---
+class Histogram:
+    __slots__ = ("counts", "total", "worst")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.total = 0.0
+        self.worst = 0.0
+
+    def observe(self, seconds):
+        self.counts[bisect_left(BUCKETS, seconds)] += 1
+        self.total += seconds
+        if seconds > self.worst:
+            self.worst = seconds
+
+    def count(self):
+        return sum(self.counts)
+
+    def to_json(self):
+        return {"count": self.count(), "sum_s": self.total, "max_s": self.worst,
+                "buckets": {str(le): n for le, n in zip(BUCKETS + ("+Inf",), self.counts)}}
+
+    def prometheus_lines(self, metric, labels):
+        """Returns the _bucket/_sum/_count lines for `metric`; `labels` is e.g. 'handler="add"'."""
+        lines = []
+        cumulative = 0
+        for le, n in zip(BUCKETS + ("+Inf",), self.counts):
+            cumulative += n
+            lines.append(f'{metric}_bucket{{{labels},le="{le}"}} {cumulative}')
+        lines.append(f'{metric}_sum{{{labels}}} {self.total}')
+        lines.append(f'{metric}_count{{{labels}}} {cumulative}')
+        return lines
+
+
+class HandlerStats:
+    __slots__ = ("calls", "errors", "latency")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.latency = Histogram()
+
+
+handlers = {}  # Handler name -> HandlerStats
+stalls = {}  # Event loop name -> Histogram of stall durations
+
+def instrument(name):
+    """Decorator: counts calls of a GUI handler and records its latency under `name`."""
+    def decorate(handler):
+        if not ENABLED:
+            return handler
+        stats = handlers.setdefault(name, HandlerStats())
+
+        @functools.wraps(handler)
+        def wrapper(*args, **kwargs):
+            stats.calls += 1
+            sampled = not stats.calls % SAMPLE_EVERY
+            start = time.perf_counter() if sampled else 0.0
+            try:
+                return handler(*args, **kwargs)
+            except BaseException:
+                stats.errors += 1
+                raise
+            finally:
+                if sampled:
+                    stats.latency.observe(time.perf_counter() - start)
+        return wrapper
+    return decorate
+
+class _Timer:
+    __slots__ = ("stats", "start")
+
+    def __init__(self, stats):
+        self.stats = stats
+        self.start = None
+
+    def __enter__(self):
+        self.stats.calls += 1
+        if not self.stats.calls % SAMPLE_EVERY:
+            self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        if exc_type is not None:
+            self.stats.errors += 1
+        if self.start is not None:
+            self.stats.latency.observe(time.perf_counter() - self.start)
+        return False
+
+_untimed = contextlib.nullcontext()
+
+def timed(name):
+    """Context manager: counts and times the block it wraps under `name`."""
+    if not ENABLED:
+        return _untimed
+    return _Timer(handlers.setdefault(name, HandlerStats()))
+
+# --- Event Loop Stalls ---
+class StallMonitor:
+    """Heartbeat that measures how late the event loop runs its timer.
+
+    The toolkit calls `tick()` every STALL_INTERVAL seconds; anything past
+    STALL_THRESHOLD beyond that is recorded as a stall.
+    """
+
+    def __init__(self, loop_name):
+        self.histogram = stalls.setdefault(loop_name, Histogram())
+        self.last = time.perf_counter()
+        start_dumping()
+
+    def tick(self):
+        now = time.perf_counter()
+        late = now - self.last - STALL_INTERVAL
+        if late >= STALL_THRESHOLD:
+            self.histogram.observe(late)
+        self.last = now
+
+def watch_tk(root, loop_name="tk"):
+    """Records stalls of a Tk event loop (no-op unless metrics are on)."""
+    if not ENABLED:
+        return None
+    monitor = StallMonitor(loop_name)
+    interval = int(STALL_INTERVAL * 1000)
+
+    def beat():
+        monitor.tick()
+        root.after(interval, beat)
+    root.after(interval, beat)
+    return monitor
+
+def watch_qt(parent, loop_name="qt"):
+    """Records stalls of the Qt event loop; the timer lives as long as `parent`."""
+    if not ENABLED:
+        return None
+    from PyQt5.QtCore import QTimer
+    monitor = StallMonitor(loop_name)
+    timer = QTimer(parent)
+    timer.timeout.connect(monitor.tick)
+    timer.start(int(STALL_INTERVAL * 1000))
+    return monitor
+
+# --- Export ---
+def to_json():
+    return {
+        "sample_every": SAMPLE_EVERY,
+        "handlers": {name: {"calls": s.calls, "errors": s.errors, "latency": s.latency.to_json()}
+                     for name, s in list(handlers.items())},
+        "stalls": {name: h.to_json() for name, h in list(stalls.items())},
+    }
+
+def to_prometheus():
+    lines = []
+    # Copies, since the GUI thread may register a timed() block while this runs
+    handler_items = list(handlers.items())
+    stall_items = list(stalls.items())
+
+    lines.append("# HELP app_handler_calls_total GUI handler calls.")
+    lines.append("# TYPE app_handler_calls_total counter")
+    for name, stats in handler_items:
+        lines.append(f'app_handler_calls_total{{handler="{name}"}} {stats.calls}')
+    lines.append("# HELP app_handler_errors_total GUI handler calls that raised.")
+    lines.append("# TYPE app_handler_errors_total counter")
+    for name, stats in handler_items:
+        lines.append(f'app_handler_errors_total{{handler="{name}"}} {stats.errors}')
+    lines.append("# HELP app_handler_seconds Latency of sampled GUI handler calls.")
+    lines.append("# TYPE app_handler_seconds histogram")
+    for name, stats in handler_items:
+        lines.extend(stats.latency.prometheus_lines("app_handler_seconds", f'handler="{name}"'))
+    lines.append("# HELP app_event_loop_stall_seconds Time the event loop was blocked past its heartbeat.")
+    lines.append("# TYPE app_event_loop_stall_seconds histogram")
+    for name, h in stall_items:
+        lines.extend(h.prometheus_lines("app_event_loop_stall_seconds", f'loop="{name}"'))
+    return "\n".join(lines) + "\n"
+
+def dump(path=None):
+    """Writes the metrics to `path` (default APP_METRICS); JSON for .json, else Prometheus text."""
+    path = path or PATH
+    if not path:
+        return
+    text = json.dumps(to_json(), indent=2) if path.endswith(".json") else to_prometheus()
+    tmp_path = path + ".tmp"
+    with _dump_lock:
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            file.write(text)
+        os.replace(tmp_path, path)
+
+_dump_lock = threading.Lock()  # The dump thread and the atexit dump share tmp_path
+_dumper = None
+
+def start_dumping():
+    """Rewrites the metrics file every DUMP_INTERVAL seconds on a daemon thread, so
+    the file write never stalls the event loop being measured."""
+    global _dumper
+    if not ENABLED or _dumper is not None:
+        return
+    _dumper = threading.Thread(target=_dump_forever, name="metrics-dump", daemon=True)
+    _dumper.start()
+
+def _dump_forever():
+    while True:
+        time.sleep(DUMP_INTERVAL)
+        dump()
+
+if ENABLED:
+    atexit.register(dump)
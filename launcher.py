@@ -0,0 +1,26 @@
+import argparse
+import importlib
+import sys
+
+# --- Configuration ---
+# Tool name -> GUI module. Each module is imported only when its tool is launched,
+# so the Qt/Tk import cost is paid by that tool alone.
+TOOLS = {
+    "todo": "todo_app",
+    "password": "password_generator",
+    "rps": "rps_game",
+}
+
+def launch(tool):
+    """Imports the GUI module for `tool` and runs it."""
+    module = importlib.import_module(TOOLS[tool])
+    return module.main()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Launch one of the desktop tools.")
+    parser.add_argument("tool", choices=sorted(TOOLS))
+    args = parser.parse_args(argv)
+    return launch(args.tool)
+
+if __name__ == '__main__':
+    sys.exit(main())
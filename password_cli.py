@@ -0,0 +1,142 @@
+import argparse
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from password_engine import ByteSampler, build_pool, generate_block
+from password_policy import PasswordPolicy
+
+# --- Configuration ---
+CHUNK_SIZE = 50000  # Passwords per work item handed to a worker
+WRITE_BUFFER = 1024 * 1024  # Output buffer size in bytes
+INFLIGHT_PER_WORKER = 2  # Work items queued per worker (bounds memory use)
+
+# --- Workers ---
+_samplers = {}
+_policies = {}
+
+def generate_chunk(count, length, pool, policy_options=None):
+    """Returns `count` passwords as one bytes block; runs in worker processes
+    (also for password_service), each reading its own stream from the OS CSPRNG."""
+    if policy_options is not None:
+        key = (length, policy_options)
+        policy = _policies.get(key)
+        if policy is None:
+            policy = _policies[key] = PasswordPolicy.from_options(length, **dict(policy_options))
+        return policy.generate_block(count)
+    sampler = _samplers.get(pool)
+    if sampler is None:
+        sampler = _samplers[pool] = ByteSampler(pool)
+    return generate_block(count, length, pool, sampler)
+
+def _chunks(count, chunk_size):
+    while count > 0:
+        n = min(chunk_size, count)
+        yield n
+        count -= n
+
+def write_passwords(out, count, length, pool, workers=1, chunk_size=CHUNK_SIZE, policy_options=None):
+    """Generates `count` passwords across `workers` processes and writes them to `out`.
+
+    With `policy_options` (keyword arguments for `PasswordPolicy.from_options`,
+    as a tuple of pairs) passwords follow that policy instead of drawing
+    freely from `pool`. At most `workers * INFLIGHT_PER_WORKER` chunks exist
+    at once, so memory stays bounded however large `count` is. Chunks are
+    written as they complete, so the line order is not meaningful.
+    """
+    # Validate the options before starting any workers
+    if policy_options is not None:
+        PasswordPolicy.from_options(length, **dict(policy_options))
+    else:
+        ByteSampler(pool)
+    if workers <= 1:
+        for n in _chunks(count, chunk_size):
+            out.write(generate_chunk(n, length, pool, policy_options))
+        return
+
+    chunks = _chunks(count, chunk_size)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = set()
+        for n in chunks:
+            pending.add(executor.submit(generate_chunk, n, length, pool, policy_options))
+            if len(pending) >= workers * INFLIGHT_PER_WORKER:
+                break
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                out.write(future.result())
+                n = next(chunks, None)
+                if n is not None:
+                    pending.add(executor.submit(generate_chunk, n, length, pool, policy_options))
+
+# --- Command Line ---
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate secure random passwords in bulk.")
+    parser.add_argument("-n", "--count", type=int, default=1, help="number of passwords (default: 1)")
+    parser.add_argument("-l", "--length", type=int, default=12, help="password length (default: 12)")
+    parser.add_argument("--no-upper", action="store_true", help="leave out uppercase letters (A-Z)")
+    parser.add_argument("--no-lower", action="store_true", help="leave out lowercase letters (a-z)")
+    parser.add_argument("--no-numbers", action="store_true", help="leave out numbers (0-9)")
+    parser.add_argument("--no-symbols", action="store_true", help="leave out symbols (!@#$...)")
+    parser.add_argument("--min-each", type=int, default=0,
+                        help="require at least this many characters of every selected type")
+    parser.add_argument("--exclude-ambiguous", action="store_true", help="leave out look-alike characters (Il1|O0o...)")
+    parser.add_argument("--max-run", type=int, default=None,
+                        help="longest run of one repeated character (1 = no repeats)")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1,
+                        help="worker processes (default: all cores)")
+    parser.add_argument("-o", "--output", default="-", help="output file, '-' for stdout (default)")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    if args.count < 0:
+        parser.error("--count must not be negative")
+    if args.length < 1:
+        parser.error("--length must be at least 1")
+    if args.min_each < 0:
+        parser.error("--min-each must not be negative")
+    if args.max_run is not None and args.max_run < 1:
+        parser.error("--max-run must be at least 1")
+    return args
+
+def policy_options(args):
+    """Returns PasswordPolicy options for the flags, or None if plain pool sampling will do."""
+    if not (args.min_each or args.exclude_ambiguous or args.max_run):
+        return None
+    return (
+        ("upper", not args.no_upper),
+        ("lower", not args.no_lower),
+        ("numbers", not args.no_numbers),
+        ("symbols", not args.no_symbols),
+        ("min_each", args.min_each),
+        ("exclude_ambiguous", args.exclude_ambiguous),
+        ("max_run", args.max_run),
+    )
+
+def main(argv=None):
+    args = parse_args(argv)
+    pool = build_pool(
+        upper=not args.no_upper,
+        lower=not args.no_lower,
+        numbers=not args.no_numbers,
+        symbols=not args.no_symbols,
+    )
+    if not pool:
+        print("Please select at least one character type.", file=sys.stderr)
+        return 2
+
+    if args.output == "-":
+        out = open(sys.stdout.fileno(), "wb", buffering=WRITE_BUFFER, closefd=False)
+    else:
+        out = open(args.output, "wb", buffering=WRITE_BUFFER)
+    try:
+        with out:
+            write_passwords(out, args.count, args.length, pool, args.workers, args.chunk_size, policy_options(args))
+    except ValueError as error:
+        print(f"Error: {error}", file=sys.stderr)
+        return 2
+    except BrokenPipeError:
+        # e.g. piped into `head`; stop quietly
+        sys.stderr.close()
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
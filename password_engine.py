@@ -0,0 +1,93 @@
+import os
+import string
+
+# --- Configuration ---
+BATCH_SIZE = 10000  # Passwords produced per block when streaming
+
+# --- Character Pools ---
+UPPERCASE = string.ascii_uppercase
+LOWERCASE = string.ascii_lowercase
+DIGITS = string.digits
+SYMBOLS = string.punctuation
+
+def build_pool(upper=True, lower=True, numbers=True, symbols=True):
+    """Builds the character pool from the same options as the GUI checkboxes."""
+    pool = ""
+    if upper:
+        pool += UPPERCASE
+    if lower:
+        pool += LOWERCASE
+    if numbers:
+        pool += DIGITS
+    if symbols:
+        pool += SYMBOLS
+    return pool
+
+# --- Secure Sampling ---
+class ByteSampler:
+    """Turns blocks of OS CSPRNG bytes into uniformly chosen pool characters.
+
+    Each random byte is mapped with a 256-entry translation table; bytes at or
+    above the largest multiple of the pool size are deleted instead (rejection
+    sampling), so every character stays equally likely. `bytes.translate`
+    does both in C over the whole block, with no per-character Python loop.
+    """
+
+    def __init__(self, pool):
+        if not pool:
+            raise ValueError("character pool is empty")
+        if len(set(pool)) != len(pool):
+            raise ValueError("character pool contains duplicates")
+        try:
+            encoded = pool.encode("ascii")
+        except UnicodeEncodeError:
+            raise ValueError("character pool must be ASCII") from None
+        if len(encoded) > 256:
+            raise ValueError("character pool is larger than 256 characters")
+        size = len(encoded)
+        limit = 256 - 256 % size
+        self.pool = pool
+        self.table = bytes(encoded[b % size] for b in range(256))
+        self.rejected = bytes(range(limit, 256))
+        self.accept_rate = limit / 256
+
+    def chars(self, count):
+        """Returns `count` random pool characters as ASCII bytes."""
+        out = bytearray()
+        while len(out) < count:
+            missing = count - len(out)
+            # Ask for a little more than the expected need so one read is usually enough
+            block = os.urandom(int(missing / self.accept_rate * 1.05) + 16)
+            out += block.translate(self.table, self.rejected)
+        del out[count:]
+        return bytes(out)
+
+# --- Generation ---
+def generate_password(length, pool):
+    """Returns one secure random password of `length` characters from `pool`."""
+    if length < 1:
+        raise ValueError("password length must be at least 1")
+    return ByteSampler(pool).chars(length).decode("ascii")
+
+def generate_block(count, length, pool, sampler=None):
+    """Returns `count` passwords as one newline-terminated bytes block."""
+    if length < 1:
+        raise ValueError("password length must be at least 1")
+    sampler = sampler or ByteSampler(pool)
+    data = sampler.chars(count * length)
+    lines = [data[i:i + length] for i in range(0, len(data), length)]
+    lines.append(b"")
+    return b"\n".join(lines)
+
+def generate_passwords(count, length, pool, batch_size=BATCH_SIZE):
+    """Yields `count` passwords, generating them `batch_size` at a time."""
+    if length < 1:
+        raise ValueError("password length must be at least 1")
+    sampler = ByteSampler(pool)
+    remaining = count
+    while remaining > 0:
+        n = min(batch_size, remaining)
+        data = sampler.chars(n * length).decode("ascii")
+        for i in range(0, len(data), length):
+            yield data[i:i + length]
+        remaining -= n
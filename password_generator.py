@@ -1,6 +1,7 @@
 import sys
-import random
-import string
+from instrumentation import instrument, watch_qt
+from password_policy import PasswordPolicy
+from password_strength import rating
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QPushButton, QLabel, QFrame, 
                              QSpinBox, QCheckBox, QLineEdit, QMessageBox)
@@ -23,6 +24,7 @@ class PasswordGeneratorApp(QMainWindow):
         self.main_layout.setSpacing(0)
         
         self.init_ui()
+        watch_qt(self)  # Event loop stall metrics (only with APP_METRICS set)
         
     def init_ui(self):
         # ================= SIDEBAR (Left) =================
@@ -114,7 +116,8 @@ class PasswordGeneratorApp(QMainWindow):
             }
             QPushButton:hover { background-color: #2ecc71; }
         """)
-        self.generate_btn.clicked.connect(self.generate_password)
+        # Lambdas, so Qt's "checked" argument isn't passed to the (possibly instrumented) handlers
+        self.generate_btn.clicked.connect(lambda: self.generate_password())
         
         # Output Area
         output_layout = QHBoxLayout()
@@ -133,11 +136,16 @@ class PasswordGeneratorApp(QMainWindow):
             }
             QPushButton:hover { background-color: #3498db; }
         """)
-        self.copy_btn.clicked.connect(self.copy_to_clipboard)
+        self.copy_btn.clicked.connect(lambda: self.copy_to_clipboard())
         
         output_layout.addWidget(self.output_field)
         output_layout.addWidget(self.copy_btn)
         
+        # Strength (entropy of the selected options, not of one sample)
+        self.strength_label = QLabel("")
+        self.strength_label.setFont(QFont("Segoe UI", 10))
+        self.strength_label.setStyleSheet("color: #7f8c8d;")
+        
         # Assemble Main Area
         self.main_area_layout.addWidget(self.header_label)
         self.main_area_layout.addLayout(length_layout)
@@ -148,37 +156,33 @@ class PasswordGeneratorApp(QMainWindow):
         self.main_area_layout.addWidget(self.generate_btn)
         self.main_area_layout.addStretch()
         self.main_area_layout.addLayout(output_layout)
+        self.main_area_layout.addWidget(self.strength_label)
         
         # ================= ASSEMBLE WINDOW =================
         self.main_layout.addWidget(self.sidebar)
         self.main_layout.addWidget(self.main_area)
 
+    @instrument("password.generate_password")
     def generate_password(self):
         """Logic to generate a random password based on user constraints."""
         length = self.length_spinbox.value()
         
-        # Build the character pool based on selected checkboxes
-        character_pool = ""
-        if self.chk_upper.isChecked():
-            character_pool += string.ascii_uppercase
-        if self.chk_lower.isChecked():
-            character_pool += string.ascii_lowercase
-        if self.chk_numbers.isChecked():
-            character_pool += string.digits
-        if self.chk_symbols.isChecked():
-            character_pool += string.punctuation
-            
         # Validation: Ensure at least one complexity option is selected
-        if not character_pool:
+        checked = [chk.isChecked() for chk in (self.chk_upper, self.chk_lower, self.chk_numbers, self.chk_symbols)]
+        if not any(checked):
             QMessageBox.warning(self, "Validation Error", "Please select at least one character type (Uppercase, Lowercase, etc.).")
             return
             
-        # Generate the password
-        generated_password = "".join(random.choices(character_pool, k=length))
+        # Every selected character type appears at least once (uniform, OS CSPRNG)
+        policy = PasswordPolicy.from_options(length, *checked, min_each=1)
+        generated_password = policy.generate()
+        bits = policy.entropy_bits()
+        self.strength_label.setText(f"Strength: {rating(bits)} ({bits:.0f} bits of entropy)")
         
         # Display the result
         self.output_field.setText(generated_password)
 
+    @instrument("password.copy_to_clipboard")
     def copy_to_clipboard(self):
         """Copies the generated password to the system clipboard."""
         password = self.output_field.text()
@@ -188,8 +192,11 @@ class PasswordGeneratorApp(QMainWindow):
         else:
             QMessageBox.warning(self, "Empty", "No password to copy! Please generate one first.")
 
-if __name__ == '__main__':
+def main():
     app = QApplication(sys.argv)
     window = PasswordGeneratorApp()
     window.show()
-    sys.exit(app.exec_())
\ No newline at end of file
+    return app.exec_()
+
+if __name__ == '__main__':
+    sys.exit(main())
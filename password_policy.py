@@ -0,0 +1,162 @@
+import itertools
+import math
+import secrets
+from password_engine import DIGITS, LOWERCASE, SYMBOLS, UPPERCASE
+
+# --- Configuration ---
+AMBIGUOUS = "Il1|O0o`'\""  # Characters that are easy to misread or mistype
+
+# --- Policy ---
+class CharClass:
+    """A named alphabet and how many of its characters a password needs."""
+
+    __slots__ = ("name", "chars", "min_count")
+
+    def __init__(self, name, chars, min_count=0):
+        self.name = name
+        self.chars = chars
+        self.min_count = min_count
+
+    def __repr__(self):
+        return f"CharClass({self.name!r}, {self.chars!r}, min_count={self.min_count})"
+
+
+class PasswordPolicy:
+    """Generates passwords that satisfy a policy by construction.
+
+    Supported rules: a minimum count per character class, excluded
+    characters (e.g. AMBIGUOUS), custom alphabets, and a maximum run of the
+    same character (`max_run=1` means no character repeats back to back).
+
+    A dynamic program counts, for every remaining length and state (class
+    minimums still owed, last class, current run length), how many valid
+    completions exist. A password is one `secrets.randbelow(total)` decoded
+    position by position through those counts, which is a bijection between
+    integers and valid passwords. That makes the result uniform over the
+    valid set with no generate-and-filter loop, and the per-password cost
+    is one pass over the length whatever the constraints are.
+    """
+
+    def __init__(self, length, classes, exclude="", max_run=None):
+        if length < 1:
+            raise ValueError("password length must be at least 1")
+        if max_run is not None and max_run < 1:
+            raise ValueError("max_run must be at least 1")
+
+        seen = set()
+        self.classes = []
+        for char_class in classes:
+            chars = "".join(c for c in char_class.chars if c not in exclude)
+            if not chars:
+                raise ValueError(f"character class {char_class.name!r} is empty")
+            if seen.intersection(chars) or len(set(chars)) != len(chars):
+                raise ValueError(f"character class {char_class.name!r} overlaps another class or repeats characters")
+            seen.update(chars)
+            self.classes.append(CharClass(char_class.name, chars, char_class.min_count))
+        if not self.classes:
+            raise ValueError("policy needs at least one character class")
+
+        self.length = length
+        self.max_run = max_run
+        self._alphabets = [c.chars for c in self.classes]
+        self._sizes = [len(chars) for chars in self._alphabets]
+        self._positions = [{ch: i for i, ch in enumerate(chars)} for chars in self._alphabets]
+        self._start = (tuple(c.min_count for c in self.classes), -1, 0)
+        self._counts = self._build_counts()
+        self.total = self._counts[length].get(self._start, 0)
+        if self.total == 0:
+            raise ValueError("no password satisfies this policy")
+
+    @classmethod
+    def from_options(cls, length, upper=True, lower=True, numbers=True, symbols=True,
+                     min_each=1, exclude_ambiguous=False, max_run=None):
+        """Builds a policy from the GUI checkboxes, requiring `min_each` of every checked class."""
+        options = [("upper", upper, UPPERCASE), ("lower", lower, LOWERCASE),
+                   ("numbers", numbers, DIGITS), ("symbols", symbols, SYMBOLS)]
+        classes = [CharClass(name, chars, min_each) for name, checked, chars in options if checked]
+        return cls(length, classes, AMBIGUOUS if exclude_ambiguous else "", max_run)
+
+    def entropy_bits(self):
+        """Returns log2 of the number of valid passwords (the entropy of one draw)."""
+        return math.log2(self.total)
+
+    # --- Generation ---
+    def generate(self):
+        """Returns one uniformly random password that satisfies the policy."""
+        r = secrets.randbelow(self.total)
+        need, last, run = self._start
+        out = []
+        prev = None
+        for remaining in range(self.length, 0, -1):
+            below = self._counts[remaining - 1]
+            for ways, j, repeat, state in self._moves(need, last, run):
+                sub = below.get(state, 0)
+                block = ways * sub
+                if r < block:
+                    break
+                r -= block
+            pick, r = divmod(r, sub)
+            chars = self._alphabets[j]
+            if repeat:
+                char = prev
+            elif j == last and self.max_run is not None:
+                # Any character of the class except the previous one
+                skip = self._positions[j][prev]
+                char = chars[pick + 1 if pick >= skip else pick]
+            else:
+                char = chars[pick]
+            out.append(char)
+            prev = char
+            need, last, run = state
+        return "".join(out)
+
+    def generate_many(self, count):
+        """Yields `count` passwords."""
+        for _ in range(count):
+            yield self.generate()
+
+    def generate_block(self, count):
+        """Returns `count` passwords as one newline-terminated bytes block."""
+        return "".join(self.generate() + "\n" for _ in range(count)).encode("utf-8")
+
+    # --- Internals ---
+    def _moves(self, need, last, run):
+        """Yields (ways, class_index, repeats_previous, next_state) for the next character."""
+        for j, size in enumerate(self._sizes):
+            if need[j]:
+                next_need = need[:j] + (need[j] - 1,) + need[j + 1:]
+            else:
+                next_need = need
+            if self.max_run is None:
+                yield size, j, False, (next_need, -1, 0)
+            elif j != last:
+                yield size, j, False, (next_need, j, 1)
+            else:
+                if size > 1:
+                    yield size - 1, j, False, (next_need, j, 1)
+                if run < self.max_run:
+                    yield 1, j, True, (next_need, j, run + 1)
+
+    def _build_counts(self):
+        """counts[n][state] = number of valid ways to fill the last n positions from `state`."""
+        needs = list(itertools.product(*(range(c.min_count + 1) for c in self.classes)))
+        if self.max_run is None:
+            tails = [(-1, 0)]
+        else:
+            tails = [(-1, 0)] + [(j, r) for j in range(len(self.classes)) for r in range(1, self.max_run + 1)]
+
+        counts = [{(need, last, run): 1 for need in needs if not any(need) for last, run in tails}]
+        for remaining in range(1, self.length + 1):
+            below = counts[-1]
+            table = {}
+            for need in needs:
+                if sum(need) > remaining:
+                    continue
+                for last, run in tails:
+                    total = 0
+                    for ways, _, _, state in self._moves(need, last, run):
+                        total += ways * below.get(state, 0)
+                    if total:
+                        table[(need, last, run)] = total
+            counts.append(table)
+        return counts
@@ -0,0 +1,295 @@
+"""Local password service: pre-generated passwords over HTTP or a Unix socket.
+
+    python password_service.py                      http://127.0.0.1:8765
+    python password_service.py --unix /tmp/pw.sock  Unix socket (mode 0600)
+
+    GET /password/<policy>?count=N   N passwords (default 1), one per line
+    GET /policies                    the policies and their settings (JSON)
+    GET /metrics                     per-policy counters and latency (Prometheus text, ?format=json for JSON)
+
+Each named policy keeps a bounded pool of passwords that a background
+thread tops up from worker processes, so a request is served by popping
+from the pool. A password is popped exactly once: it leaves memory with
+the response and is never logged or cached. If a pool runs dry, the
+request generates its passwords inline (counted as a miss).
+"""
+import argparse
+import json
+import os
+import signal
+import stat
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from socketserver import ThreadingMixIn, UnixStreamServer
+from urllib.parse import parse_qs, urlsplit
+from instrumentation import Histogram
+from password_cli import generate_chunk
+from password_policy import PasswordPolicy
+
+# --- Configuration ---
+HOST = "127.0.0.1"
+PORT = 8765
+POOL_SIZE = 2000  # Passwords kept ready per policy (upper bound)
+LOW_WATER = 0.5  # Refill once a pool drops below this fraction of POOL_SIZE
+REFILL_CHUNK = 500  # Passwords per work item sent to a worker process
+MAX_COUNT = 1000  # Passwords per request
+
+# Common policies: name -> (length, PasswordPolicy.from_options keyword arguments)
+POLICIES = {
+    "default": (16, {"min_each": 1}),
+    "strong": (24, {"min_each": 2, "exclude_ambiguous": True}),
+    "alnum": (20, {"symbols": False, "min_each": 1}),
+    "readable": (14, {"symbols": False, "min_each": 1, "exclude_ambiguous": True, "max_run": 2}),
+    "pin": (6, {"upper": False, "lower": False, "symbols": False, "min_each": 0}),
+}
+
+# --- Pools ---
+class PolicyPool:
+    """Ready-made passwords for one policy, plus its metrics.
+
+    `take()` pops from a deque, which is atomic, so two requests can never
+    receive the same password. The pool never holds more than `size`
+    passwords; a refill thread keeps it above `low_water`.
+    """
+
+    def __init__(self, name, length, options, size=POOL_SIZE):
+        self.name = name
+        self.length = length
+        self.options = tuple(sorted(options.items()))  # Hashable, as generate_chunk expects
+        self.policy = PasswordPolicy.from_options(length, **options)
+        self.size = size
+        self.low_water = int(size * LOW_WATER)
+        self.passwords = deque(maxlen=size)
+        self.wanted = threading.Event()
+        self.wanted.set()
+        # Metrics (updated under _lock; reads for /metrics are approximate)
+        self.served = 0
+        self.requests = 0
+        self.misses = 0
+        self.generated = 0
+        self.latency = Histogram()
+        self._lock = threading.Lock()
+
+    def take(self, count):
+        """Returns `count` passwords that no other caller will ever get."""
+        out = []
+        try:
+            for _ in range(count):
+                out.append(self.passwords.popleft())
+        except IndexError:
+            pass
+        missing = count - len(out)
+        if missing:
+            out.extend(self.policy.generate() for _ in range(missing))
+        if len(self.passwords) < self.low_water:
+            self.wanted.set()
+        with self._lock:
+            self.requests += 1
+            self.served += count
+            self.misses += missing
+        return out
+
+    def record_latency(self, seconds):
+        with self._lock:
+            self.latency.observe(seconds)
+
+    def refill(self, executor, stop):
+        """Refill thread: tops the pool up from worker processes whenever it runs low."""
+        while not stop.is_set():
+            self.wanted.wait()
+            if stop.is_set():
+                return
+            self.wanted.clear()
+            while len(self.passwords) < self.size and not stop.is_set():
+                count = min(REFILL_CHUNK, self.size - len(self.passwords))
+                block = executor.submit(generate_chunk, count, self.length, "", self.options).result()
+                # splitlines + extend run in C, so request threads barely wait on the GIL
+                self.passwords.extend(block.decode("ascii").splitlines())
+                with self._lock:
+                    self.generated += count
+
+    def info(self):
+        return {"length": self.length, "options": dict(self.options), "pool_size": self.size,
+                "ready": len(self.passwords), "entropy_bits": round(self.policy.entropy_bits(), 1)}
+
+
+class PasswordService:
+    """The policy pools, their refill threads and the worker processes behind them."""
+
+    def __init__(self, policies=POLICIES, size=POOL_SIZE, workers=1):
+        self.pools = {name: PolicyPool(name, length, options, size) for name, (length, options) in policies.items()}
+        self.workers = workers
+        self.started = time.monotonic()
+        self._executor = None
+        self._stop = threading.Event()
+        self._threads = []
+
+    def start(self):
+        # Workers ignore Ctrl-C; stop() shuts them down once the server has stopped
+        self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=signal.signal,
+                                             initargs=(signal.SIGINT, signal.SIG_IGN))
+        for pool in self.pools.values():
+            thread = threading.Thread(target=pool.refill, args=(self._executor, self._stop),
+                                      name=f"refill-{pool.name}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def stop(self):
+        self._stop.set()
+        for pool in self.pools.values():
+            pool.wanted.set()
+        for thread in self._threads:
+            thread.join()
+        self._executor.shutdown(cancel_futures=True)
+
+    # --- Metrics ---
+    def metrics_json(self):
+        uptime = time.monotonic() - self.started
+        result = {"uptime_s": uptime, "policies": {}}
+        for name, pool in self.pools.items():
+            result["policies"][name] = {
+                "requests": pool.requests, "served": pool.served, "misses": pool.misses,
+                "generated": pool.generated, "ready": len(pool.passwords),
+                "served_per_s": pool.served / uptime if uptime else 0.0,
+                "latency": pool.latency.to_json(),
+            }
+        return result
+
+    def metrics_prometheus(self):
+        lines = []
+        counters = [("requests", "Requests served."), ("served", "Passwords handed out."),
+                    ("misses", "Passwords generated inline because the pool was empty."),
+                    ("generated", "Passwords generated into the pool.")]
+        for field, help_text in counters:
+            lines.append(f"# HELP password_service_{field}_total {help_text}")
+            lines.append(f"# TYPE password_service_{field}_total counter")
+            for name, pool in self.pools.items():
+                lines.append(f'password_service_{field}_total{{policy="{name}"}} {getattr(pool, field)}')
+        lines.append("# HELP password_service_pool_ready Passwords ready in the pool.")
+        lines.append("# TYPE password_service_pool_ready gauge")
+        for name, pool in self.pools.items():
+            lines.append(f'password_service_pool_ready{{policy="{name}"}} {len(pool.passwords)}')
+        lines.append("# HELP password_service_request_seconds Time from request to response.")
+        lines.append("# TYPE password_service_request_seconds histogram")
+        for name, pool in self.pools.items():
+            lines.extend(pool.latency.prometheus_lines("password_service_request_seconds", f'policy="{name}"'))
+        return "\n".join(lines) + "\n"
+
+# --- HTTP ---
+class RequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive, so clients skip a connect per request
+    disable_nagle_algorithm = True  # Headers and body are separate writes; don't wait on delayed ACKs
+    service = None  # Set by make_server
+
+    def do_GET(self):
+        start = time.perf_counter()
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+        if url.path.startswith("/password/"):
+            pool = self.service.pools.get(url.path[len("/password/"):])
+            if pool is None:
+                self.respond(404, "unknown policy\n")
+                return
+            try:
+                count = int(query.get("count", ["1"])[0])
+            except ValueError:
+                count = 0
+            if not 1 <= count <= MAX_COUNT:
+                self.respond(400, f"count must be between 1 and {MAX_COUNT}\n")
+                return
+            self.respond(200, "\n".join(pool.take(count)) + "\n")
+            pool.record_latency(time.perf_counter() - start)
+        elif url.path == "/policies":
+            self.respond(200, json.dumps({name: pool.info() for name, pool in self.service.pools.items()}),
+                         "application/json")
+        elif url.path == "/metrics":
+            if query.get("format") == ["json"]:
+                self.respond(200, json.dumps(self.service.metrics_json()), "application/json")
+            else:
+                self.respond(200, self.service.metrics_prometheus(), "text/plain; version=0.0.4; charset=utf-8")
+        else:
+            self.respond(404, "not found\n")
+
+    def respond(self, status, text, content_type="text/plain; charset=utf-8"):
+        body = text.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Quiet by default: request logs cost latency and there's nothing worth keeping
+        pass
+
+
+class ThreadingUnixHTTPServer(ThreadingMixIn, UnixStreamServer):
+    daemon_threads = True
+
+    def get_request(self):
+        request, _ = super().get_request()
+        return request, ("unix", 0)  # BaseHTTPRequestHandler expects a (host, port) address
+
+
+def make_server(service, host=HOST, port=PORT, unix_path=None):
+    handler = type("BoundRequestHandler", (RequestHandler,),
+                   {"service": service, "disable_nagle_algorithm": unix_path is None})
+    if unix_path is None:
+        return ThreadingHTTPServer((host, port), handler)
+    remove_stale_socket(unix_path)
+    # Only the owner may ask for passwords: the socket is created 0600, never briefly wider
+    old_umask = os.umask(0o077)
+    try:
+        return ThreadingUnixHTTPServer(unix_path, handler)
+    finally:
+        os.umask(old_umask)
+
+def remove_stale_socket(path):
+    """Removes a socket left behind at `path`; refuses to delete anything else."""
+    try:
+        mode = os.lstat(path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(f"{path} exists and is not a socket")
+    os.remove(path)
+
+# --- Command Line ---
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve pre-generated passwords over local HTTP.")
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--unix", metavar="PATH", help="listen on a Unix socket instead of TCP")
+    parser.add_argument("--pool-size", type=int, default=POOL_SIZE, help="passwords kept ready per policy")
+    parser.add_argument("-w", "--workers", type=int, default=1, help="worker processes for refills")
+    args = parser.parse_args(argv)
+    if args.pool_size < 1:
+        parser.error("--pool-size must be at least 1")
+
+    service = PasswordService(size=args.pool_size, workers=args.workers)
+    try:
+        server = make_server(service, args.host, args.port, args.unix)
+    except OSError as error:
+        parser.error(str(error))
+    service.start()
+    where = args.unix or "http://%s:%d" % server.server_address[:2]
+    print(f"password service on {where} (policies: {', '.join(service.pools)})", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.stop()
+        if args.unix:
+            remove_stale_socket(args.unix)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
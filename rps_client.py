@@ -0,0 +1,71 @@
+"""Asyncio client for rps_server's line protocol (used by bots and load tests)."""
+import asyncio
+from rps_server import HOST, PORT, PROTOCOL
+
+def parse_message(line):
+    """Splits a server line into (command, [arguments])."""
+    command, *arguments = line.split()
+    return command, arguments
+
+
+class MatchClient:
+    def __init__(self, name=None):
+        self.name = name
+        self.reader = None
+        self.writer = None
+        self.match_id = None
+        self.opponent = None
+
+    async def connect(self, host=HOST, port=PORT):
+        self.reader, self.writer = await asyncio.open_connection(host, port)
+        command, arguments = await self.receive()
+        if command != "WELCOME" or arguments != [PROTOCOL]:
+            raise ConnectionError(f"unexpected greeting: {command} {' '.join(arguments)}")
+        return self
+
+    async def send(self, line):
+        self.writer.write((line + "\n").encode("utf-8"))
+        await self.writer.drain()
+
+    async def receive(self):
+        line = await self.reader.readline()
+        if not line:
+            raise ConnectionError("server closed the connection")
+        return parse_message(line.decode("utf-8"))
+
+    async def find_match(self):
+        """Queues for a match and waits until paired; returns the opponent's name."""
+        await self.send(f"PLAY {self.name}" if self.name else "PLAY")
+        while True:
+            command, arguments = await self.receive()
+            if command == "MATCHED":
+                self.match_id, self.opponent = int(arguments[0]), arguments[1]
+                return self.opponent
+            if command == "ERROR":
+                raise RuntimeError(" ".join(arguments))
+
+    async def play(self, move):
+        """Plays one move ("Rock", "Paper" or "Scissors").
+
+        Returns the RESULT arguments (your_move, their_move, outcome,
+        your_score, their_score), or None if the match ended instead.
+        """
+        await self.send(f"MOVE {move}")
+        while True:
+            command, arguments = await self.receive()
+            if command == "RESULT":
+                return arguments
+            if command == "END":
+                self.match_id = None
+                return None
+            if command == "ERROR":
+                raise RuntimeError(" ".join(arguments))
+
+    async def close(self):
+        if self.writer is not None:
+            try:
+                await self.send("QUIT")
+            except ConnectionError:
+                pass
+            self.writer.close()
+            self.writer = None
@@ -0,0 +1,36 @@
+import random
+
+# --- Rules ---
+CHOICES = ['Rock', 'Paper', 'Scissors']
+BEATS = {'Rock': 'Scissors', 'Paper': 'Rock', 'Scissors': 'Paper'}  # move -> the move it beats
+
+WIN = "win"
+LOSS = "loss"
+TIE = "tie"
+
+def resolve_round(user_choice, comp_choice):
+    """Returns WIN, LOSS or TIE from the user's point of view."""
+    if user_choice not in BEATS or comp_choice not in BEATS:
+        raise ValueError(f"unknown move: {user_choice!r} vs {comp_choice!r}")
+    if user_choice == comp_choice:
+        return TIE
+    if BEATS[user_choice] == comp_choice:
+        return WIN
+    return LOSS
+
+def random_choice(rng=random):
+    """Picks the computer's move uniformly at random."""
+    return rng.choice(CHOICES)
+
+# --- Integer Encoding ---
+# Moves as small integers for batch work: (a - b) % 3 == 1 means a beats b
+ROCK, PAPER, SCISSORS = 0, 1, 2
+MOVE_CODES = {'Rock': ROCK, 'Paper': PAPER, 'Scissors': SCISSORS}
+
+# Outcome codes, from the first player's point of view
+TIE_CODE, WIN_CODE, LOSS_CODE = 0, 1, 2
+OUTCOME_NAMES = {TIE_CODE: TIE, WIN_CODE: WIN, LOSS_CODE: LOSS}
+
+def resolve_code(a, b):
+    """Integer version of resolve_round: returns TIE_CODE, WIN_CODE or LOSS_CODE."""
+    return (a - b) % 3
@@ -1,18 +1,37 @@
 import sys
 import random
+from instrumentation import instrument, watch_qt
+from rps_core import CHOICES, MOVE_CODES, TIE, WIN, resolve_round
+from rps_history import RoundHistory
+from rps_strategies import MarkovStrategy, RandomStrategy
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
-                             QHBoxLayout, QPushButton, QLabel, QFrame)
+                             QHBoxLayout, QPushButton, QLabel, QFrame, QComboBox)
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QFont
+from PyQt5.QtNetwork import QTcpSocket
+
+# Every round ever played is archived here (stats survive Reset Game)
+HISTORY_FILE = "rps_history.bin"
+
+# Computer opponents offered in the sidebar (any rps_strategies.Strategy works)
+OPPONENTS = {
+    "Random": RandomStrategy,
+    "Adaptive": MarkovStrategy,
+}
 
 class RPSGame(QMainWindow):
-    def __init__(self):
+    def __init__(self, strategy=None, history_file=HISTORY_FILE, server=None):
         super().__init__()
         
         # Game State
         self.user_score = 0
         self.computer_score = 0
-        self.choices = ['Rock', 'Paper', 'Scissors']
+        self.choices = CHOICES
+        self.rng = random.Random()
+        self.strategy = strategy or RandomStrategy()
+        self.history = RoundHistory(history_file).open()
+        self.socket = None  # Set when playing other people through rps_server
+        self.opponent_name = "Computer"
         
         # Window Configuration
         self.setWindowTitle("Rock Paper Scissors - Demo")
@@ -26,6 +45,9 @@ class RPSGame(QMainWindow):
         self.main_layout.setSpacing(0)
         
         self.init_ui()
+        watch_qt(self)  # Event loop stall metrics (only with APP_METRICS set)
+        if server is not None:
+            self.connect_to_server(*server)
         
     def init_ui(self):
         # ================= SIDEBAR (Left) =================
@@ -48,6 +70,21 @@ class RPSGame(QMainWindow):
         self.comp_score_label = QLabel(f"Computer: {self.computer_score}")
         self.comp_score_label.setFont(QFont("Arial", 12))
         
+        # All-time Stats (read from the archive's running aggregates)
+        self.stats_label = QLabel()
+        self.stats_label.setFont(QFont("Arial", 9))
+        self.stats_label.setStyleSheet("color: #bdc3c7;")
+        self.stats_label.setWordWrap(True)
+        self.update_stats()
+        
+        # Opponent Picker
+        opponent_label = QLabel("Opponent:")
+        opponent_label.setFont(QFont("Arial", 10))
+        self.opponent_box = QComboBox()
+        self.opponent_box.addItems(OPPONENTS)
+        self.opponent_box.setStyleSheet("color: #2c3e50; background-color: white; padding: 4px;")
+        self.opponent_box.currentTextChanged.connect(self.set_opponent)
+        
         # Reset / Play Again Button
         self.reset_btn = QPushButton("🔄 Reset Game")
         self.reset_btn.setCursor(Qt.PointingHandCursor)
@@ -57,13 +94,16 @@ class RPSGame(QMainWindow):
             }
             QPushButton:hover { background-color: #c0392b; }
         """)
-        self.reset_btn.clicked.connect(self.reset_game)
+        self.reset_btn.clicked.connect(lambda: self.reset_game())
         
         # Add to Sidebar Layout
         self.sidebar_layout.addWidget(score_title)
         self.sidebar_layout.addWidget(self.user_score_label)
         self.sidebar_layout.addWidget(self.comp_score_label)
+        self.sidebar_layout.addWidget(self.stats_label)
         self.sidebar_layout.addStretch()
+        self.sidebar_layout.addWidget(opponent_label)
+        self.sidebar_layout.addWidget(self.opponent_box)
         self.sidebar_layout.addWidget(self.reset_btn)
         
         # ================= MAIN AREA (Right) =================
@@ -131,54 +171,165 @@ class RPSGame(QMainWindow):
         self.main_layout.addWidget(self.sidebar)
         self.main_layout.addWidget(self.main_area)
 
+    @instrument("rps.play_round")
     def play_round(self, user_choice):
         """Game logic and validation happens here."""
-        # Computer randomly selects
-        comp_choice = random.choice(self.choices)
+        if self.socket is not None:
+            # The server resolves the round once the opponent has moved too
+            self.socket.write(f"MOVE {user_choice}\n".encode("utf-8"))
+            self.set_buttons_enabled(False)
+            self.instruction_label.setText(f"Waiting for {self.opponent_name}...")
+            return
+
+        # Computer selects through its strategy, then learns from the round
+        comp_choice = self.choices[self.strategy.choose(self.rng)]
+        self.strategy.observe(MOVE_CODES[comp_choice], MOVE_CODES[user_choice])
+        self.show_result(user_choice, comp_choice, resolve_round(user_choice, comp_choice))
+
+    def show_result(self, user_choice, comp_choice, outcome):
+        """Archives a finished round and updates the scoreboard."""
+        self.history.record(MOVE_CODES[user_choice], MOVE_CODES[comp_choice])
         
         # Determine Winner
-        if user_choice == comp_choice:
+        if outcome == TIE:
             result = "It's a Tie! 🤝"
             color = "#f39c12" # Orange
-        elif (user_choice == 'Rock' and comp_choice == 'Scissors') or \
-             (user_choice == 'Paper' and comp_choice == 'Rock') or \
-             (user_choice == 'Scissors' and comp_choice == 'Paper'):
+        elif outcome == WIN:
             result = "You Win! 🎉"
             color = "#27ae60" # Green
             self.user_score += 1
         else:
-            result = "Computer Wins! 😢"
+            result = f"{self.opponent_name} Wins! 😢"
             color = "#c0392b" # Red
             self.computer_score += 1
             
         # Update UI Feedback
-        feedback_text = f"You chose <b>{user_choice}</b>.<br>Computer chose <b>{comp_choice}</b>.<br><br><span style='font-size:18px; color:{color};'>{result}</span>"
+        feedback_text = f"You chose <b>{user_choice}</b>.<br>{self.opponent_name} chose <b>{comp_choice}</b>.<br><br><span style='font-size:18px; color:{color};'>{result}</span>"
         self.result_label.setText(feedback_text)
         
         # Update Scoreboard
         self.user_score_label.setText(f"You: {self.user_score}")
-        self.comp_score_label.setText(f"Computer: {self.computer_score}")
+        self.comp_score_label.setText(f"{self.opponent_name}: {self.computer_score}")
+        self.update_stats()
         self.instruction_label.setText("Play Again?")
 
+    def set_buttons_enabled(self, enabled):
+        for button in (self.rock_btn, self.paper_btn, self.scissors_btn):
+            button.setEnabled(enabled)
+
+    # --- Network Play (see rps_server.py for the protocol) ---
+    def connect_to_server(self, host, port):
+        """Plays against other people through an rps_server instead of the computer."""
+        socket = self.socket = QTcpSocket(self)
+        socket.connected.connect(lambda: socket.write(b"PLAY\n"))
+        socket.readyRead.connect(self.read_server)
+        socket.disconnected.connect(lambda: self.leave_server("Disconnected from server."))
+        socket.errorOccurred.connect(lambda _: self.leave_server(f"Server error: {socket.errorString()}."))
+        self.opponent_box.setEnabled(False)
+        self.set_buttons_enabled(False)
+        self.show_status(f"Connecting to {host}:{port}...")
+        self.socket.connectToHost(host, port)
+
+    def leave_server(self, reason):
+        """Drops the server connection and goes back to playing the computer."""
+        socket, self.socket = self.socket, None
+        if socket is None:
+            return  # A socket error is usually followed by "disconnected"
+        socket.blockSignals(True)
+        socket.abort()
+        socket.deleteLater()
+        self.opponent_name = "Computer"
+        self.opponent_box.setEnabled(True)
+        self.reset_game()
+        self.set_buttons_enabled(True)
+        self.show_status(f"{reason} Playing the computer now.")
+
+    def read_server(self):
+        while self.socket is not None and self.socket.canReadLine():
+            command, *arguments = bytes(self.socket.readLine()).decode("utf-8").split()
+            if command == "WAITING":
+                self.show_status("Waiting for an opponent...")
+            elif command == "MATCHED":
+                self.opponent_name = arguments[1]
+                self.reset_game()
+                self.set_buttons_enabled(True)
+            elif command == "RESULT":
+                user_choice, their_choice, outcome = arguments[:3]
+                self.show_result(user_choice, their_choice, outcome)
+                self.set_buttons_enabled(True)
+            elif command == "END":
+                # Queue up for the next match straight away
+                self.set_buttons_enabled(False)
+                self.show_status(f"Match over ({arguments[0].replace('_', ' ')}). Finding a new opponent...")
+                self.socket.write(b"PLAY\n")
+            elif command == "ERROR":
+                self.set_buttons_enabled(True)
+                self.show_status(" ".join(arguments))
+
+    def show_status(self, text):
+        self.instruction_label.setText(text)
+
+    def update_stats(self):
+        """Shows all-time stats; O(1) however many rounds are archived."""
+        stats = self.history.stats
+        favorite = self.choices[max(range(3), key=stats.user_moves.__getitem__)] if stats.rounds else "-"
+        if stats.streak > 0:
+            streak = f"{stats.streak} win(s)"
+        elif stats.streak < 0:
+            streak = f"{-stats.streak} loss(es)"
+        else:
+            streak = "-"
+        self.stats_label.setText(
+            f"All time: {stats.rounds} rounds\n"
+            f"Win rate: {stats.win_rate():.0%}\n"
+            f"Favorite move: {favorite}\n"
+            f"Streak: {streak} (best {stats.best_win_streak})"
+        )
+
+    def set_opponent(self, name):
+        """Switches the computer to another strategy and starts over."""
+        self.strategy = OPPONENTS[name]()
+        self.reset_game()
+
+    @instrument("rps.reset_game")
     def reset_game(self):
         """Resets scores and UI back to default."""
+        self.strategy.reset()
         self.user_score = 0
         self.computer_score = 0
         self.user_score_label.setText(f"You: {self.user_score}")
-        self.comp_score_label.setText(f"Computer: {self.computer_score}")
+        self.comp_score_label.setText(f"{self.opponent_name}: {self.computer_score}")
         self.instruction_label.setText("Make your choice to play!")
         self.result_label.setText("Waiting for your move...")
         self.result_label.setStyleSheet("color: #7f8c8d; margin: 20px 0;")
 
+    def closeEvent(self, event):
+        if self.socket is not None:
+            self.socket.write(b"QUIT\n")
+            self.socket.flush()
+        self.history.close()
+        super().closeEvent(event)
 
-if __name__ == '__main__':
-    app = QApplication(sys.argv)
+
+def main(argv=None):
+    argv = sys.argv if argv is None else argv
+    # "--server host:port" plays other people through rps_server.py
+    server = None
+    if "--server" in argv[1:-1]:
+        host, port = argv[argv.index("--server") + 1].rsplit(":", 1)
+        server = (host, int(port))
+    
+    app = QApplication(argv)
     
     # Optional: Set a global font
     font = QFont("Arial", 10)
     app.setFont(font)
     
-    window = RPSGame()
+    window = RPSGame(server=server)
     window.show()
     
-    sys.exit(app.exec_())
\ No newline at end of file
+    return app.exec_()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
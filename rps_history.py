@@ -0,0 +1,172 @@
+import mmap
+import os
+import re
+import struct
+import time
+import zlib
+from rps_core import LOSS_CODE, TIE_CODE, WIN_CODE, resolve_code
+
+# --- Configuration ---
+RECORD = struct.Struct("<dBBBx")  # timestamp, user move, computer move, outcome (user's view)
+STATS = struct.Struct("<10qI")  # RoundStats fields + CRC of them
+MOVE_OFFSET = 8  # Byte offset of the user move inside a record
+OUTCOME_OFFSET = 10  # Byte offset of the outcome inside a record
+
+# --- Aggregates ---
+class RoundStats:
+    """Running totals over every archived round, updated in O(1) per round."""
+
+    __slots__ = ("rounds", "wins", "losses", "ties", "user_moves", "streak",
+                 "best_win_streak", "best_loss_streak")
+
+    def __init__(self):
+        self.rounds = 0
+        self.wins = 0
+        self.losses = 0
+        self.ties = 0
+        self.user_moves = [0, 0, 0]  # Rock, Paper, Scissors
+        self.streak = 0  # > 0: current run of wins, < 0: current run of losses
+        self.best_win_streak = 0
+        self.best_loss_streak = 0
+
+    def add(self, user, outcome):
+        self.rounds += 1
+        self.user_moves[user] += 1
+        if outcome == WIN_CODE:
+            self.wins += 1
+            self.streak = self.streak + 1 if self.streak > 0 else 1
+            self.best_win_streak = max(self.best_win_streak, self.streak)
+        elif outcome == LOSS_CODE:
+            self.losses += 1
+            self.streak = self.streak - 1 if self.streak < 0 else -1
+            self.best_loss_streak = max(self.best_loss_streak, -self.streak)
+        else:
+            self.ties += 1
+            self.streak = 0
+
+    def win_rate(self):
+        return self.wins / self.rounds if self.rounds else 0.0
+
+    def pack(self):
+        fields = (self.rounds, self.wins, self.losses, self.ties, *self.user_moves,
+                  self.streak, self.best_win_streak, self.best_loss_streak)
+        return STATS.pack(*fields, zlib.crc32(struct.pack("<10q", *fields)))
+
+    @classmethod
+    def unpack(cls, data):
+        """Returns the stats stored in `data`, or None if they are torn or corrupt."""
+        if len(data) != STATS.size:
+            return None
+        *fields, crc = STATS.unpack(data)
+        if zlib.crc32(struct.pack("<10q", *fields)) != crc:
+            return None
+        stats = cls()
+        (stats.rounds, stats.wins, stats.losses, stats.ties, rock, paper, scissors,
+         stats.streak, stats.best_win_streak, stats.best_loss_streak) = fields
+        stats.user_moves = [rock, paper, scissors]
+        return stats
+
+    @classmethod
+    def from_log(cls, data):
+        """Recomputes the stats from raw log bytes (e.g. a memory map).
+
+        Strided slices pull one column out of the fixed-size records, so
+        counting and streak finding run in C instead of per record.
+        """
+        size = RECORD.size
+        moves = data[MOVE_OFFSET::size]
+        outcomes = data[OUTCOME_OFFSET::size]
+        stats = cls()
+        stats.rounds = len(outcomes)
+        stats.wins = outcomes.count(WIN_CODE)
+        stats.losses = outcomes.count(LOSS_CODE)
+        stats.ties = outcomes.count(TIE_CODE)
+        stats.user_moves = [moves.count(move) for move in range(3)]
+        stats.best_win_streak = max(map(len, re.findall(rb"\x01+", outcomes)), default=0)
+        stats.best_loss_streak = max(map(len, re.findall(rb"\x02+", outcomes)), default=0)
+        trailing_wins = len(outcomes) - len(outcomes.rstrip(b"\x01"))
+        trailing_losses = len(outcomes) - len(outcomes.rstrip(b"\x02"))
+        stats.streak = trailing_wins or -trailing_losses
+        return stats
+
+# --- Archive ---
+class RoundHistory:
+    """Append-only archive of every round played, plus cached aggregates.
+
+    Rounds go to `path` as fixed-size binary records. The aggregates are
+    kept in `<path>.stats` and rewritten after every round, so opening an
+    archive of any size only reads a few bytes. If that file is missing or
+    doesn't match the log (e.g. after a crash), the stats are rebuilt from a
+    memory map of the log.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.stats_path = path + ".stats"
+        self.stats = RoundStats()
+        self._log = None
+        self._stats_file = None
+
+    def open(self):
+        self._log = open(self.path, "ab")
+        size = self._log.tell()
+        if size % RECORD.size:
+            # Drop a record torn by a crash mid-write
+            self._log.truncate(size - size % RECORD.size)
+            self._log.seek(0, os.SEEK_END)
+        count = self._log.tell() // RECORD.size
+
+        self._stats_file = open(self.stats_path, "r+b" if os.path.exists(self.stats_path) else "w+b")
+        stats = RoundStats.unpack(self._stats_file.read(STATS.size))
+        if stats is None or stats.rounds != count:
+            stats = self._rebuild()
+        self.stats = stats
+        self._write_stats()
+        return self
+
+    def record(self, user, computer, when=None):
+        """Archives one round (integer move codes) and returns its outcome code."""
+        outcome = resolve_code(user, computer)
+        self._log.write(RECORD.pack(when if when is not None else time.time(), user, computer, outcome))
+        self._log.flush()
+        self.stats.add(user, outcome)
+        self._write_stats()
+        return outcome
+
+    def recent(self, count):
+        """Returns the last `count` rounds as (timestamp, user, computer, outcome) tuples."""
+        data = self._map()
+        if data is None:
+            return []
+        with data:
+            start = max(0, len(data) - count * RECORD.size)
+            return list(RECORD.iter_unpack(data[start:]))
+
+    def close(self):
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+        if self._stats_file is not None:
+            self._stats_file.close()
+            self._stats_file = None
+
+    # --- Internals ---
+    def _write_stats(self):
+        self._stats_file.seek(0)
+        self._stats_file.write(self.stats.pack())
+        self._stats_file.flush()
+
+    def _map(self):
+        """Memory-maps the log read-only (None while it is empty)."""
+        self._log.flush()
+        if os.path.getsize(self.path) == 0:
+            return None
+        with open(self.path, "rb") as file:
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _rebuild(self):
+        data = self._map()
+        if data is None:
+            return RoundStats()
+        with data:
+            return RoundStats.from_log(data)
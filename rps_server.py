@@ -0,0 +1,254 @@
+"""Rock-Paper-Scissors match server (asyncio, line protocol over TCP).
+
+Every message is one UTF-8 line. Client -> server:
+
+    PLAY [name]        join the matchmaking queue
+    MOVE <move>        play Rock, Paper or Scissors in the current match
+    QUIT               disconnect
+
+Server -> client:
+
+    WELCOME rps/1
+    WAITING            queued until another player arrives
+    MATCHED <match_id> <opponent_name>
+    RESULT <your_move> <their_move> <win|loss|tie> <your_score> <their_score>
+    END <reason>       match over: timeout, opponent_left or rounds; send PLAY again
+    ERROR <message>
+
+Both players must send MOVE within `move_timeout` seconds of the previous
+round, otherwise the match ends with "timeout".
+"""
+import argparse
+import asyncio
+import itertools
+import sys
+from rps_core import CHOICES, LOSS_CODE, MOVE_CODES, OUTCOME_NAMES, WIN_CODE, resolve_code
+
+# --- Configuration ---
+HOST = "127.0.0.1"
+PORT = 5757
+MOVE_TIMEOUT = 30.0  # Seconds both players get to move in each round
+PROTOCOL = "rps/1"
+
+MOVES_BY_NAME = {name.lower(): code for name, code in MOVE_CODES.items()}
+
+def parse_move(token):
+    """Returns the move code for a name like "rock" (case-insensitive), or None."""
+    return MOVES_BY_NAME.get(token.lower())
+
+
+class Player:
+    __slots__ = ("name", "writer", "match", "side", "queued", "closed")
+
+    def __init__(self, name, writer):
+        self.name = name
+        self.writer = writer
+        self.match = None
+        self.side = 0  # This player's index in match.players
+        self.queued = False
+        self.closed = False
+
+    def send(self, line):
+        if not self.closed:
+            self.writer.write((line + "\n").encode("utf-8"))
+
+
+class Match:
+    """One match's round state.
+
+    Each round waits on a single future that completes when both moves are
+    in, a player leaves or the move timer fires, so a round costs one
+    future and one timer instead of a task per player.
+    """
+
+    __slots__ = ("id", "players", "moves", "scores", "rounds", "ready")
+
+    def __init__(self, match_id, a, b):
+        self.id = match_id
+        self.players = (a, b)
+        self.moves = [None, None]
+        self.scores = [0, 0]
+        self.rounds = 0
+        self.ready = None
+
+    def submit(self, side, move):
+        """Records a move; returns False if that player already moved this round."""
+        if self.moves[side] is not None:
+            return False
+        self.moves[side] = move
+        if self.moves[1 - side] is not None:
+            self._finish(None)
+        return True
+
+    def leave(self):
+        self._finish("opponent_left")
+
+    def _finish(self, reason):
+        if self.ready is not None and not self.ready.done():
+            self.ready.set_result(reason)
+
+    async def next_round(self, timeout):
+        """Waits for both moves; returns None, or the reason the match must end."""
+        loop = asyncio.get_running_loop()
+        self.ready = loop.create_future()
+        if None not in self.moves or any(player.closed for player in self.players):
+            self._finish(None if None not in self.moves else "opponent_left")
+        timer = loop.call_later(timeout, self._finish, "timeout")
+        try:
+            return await self.ready
+        finally:
+            timer.cancel()
+
+
+class MatchServer:
+    """Pairs waiting players and runs each match as its own asyncio task."""
+
+    def __init__(self, host=HOST, port=PORT, move_timeout=MOVE_TIMEOUT, max_rounds=0):
+        self.host = host
+        self.port = port
+        self.move_timeout = move_timeout
+        self.max_rounds = max_rounds  # 0 means a match runs until someone leaves or times out
+        self.waiting = asyncio.Queue()
+        self.rounds_played = 0
+        self.matches_started = 0
+        self.active_matches = 0
+        self._ids = itertools.count(1)
+        self._guests = itertools.count(1)
+        self._server = None
+        self._matchmaker = None
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._matchmaker = asyncio.create_task(self._matchmake())
+        return self
+
+    async def serve_forever(self):
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        self._matchmaker.cancel()
+        self._server.close()
+        await self._server.wait_closed()
+
+    # --- Connections ---
+    async def _handle(self, reader, writer):
+        player = Player(f"guest{next(self._guests)}", writer)
+        player.send(f"WELCOME {PROTOCOL}")
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                command, _, argument = line.decode("utf-8", "replace").strip().partition(" ")
+                command = command.upper()
+                if command == "MOVE":
+                    move = parse_move(argument.strip())
+                    if move is None:
+                        player.send("ERROR unknown move")
+                    elif player.match is None:
+                        player.send("ERROR not in a match")
+                    elif not player.match.submit(player.side, move):
+                        player.send("ERROR already moved this round")
+                elif command == "PLAY":
+                    if player.match is not None or player.queued:
+                        player.send("ERROR already playing")
+                        continue
+                    if argument:
+                        player.name = argument.split()[0]
+                    player.queued = True
+                    player.send("WAITING")
+                    self.waiting.put_nowait(player)
+                elif command == "QUIT":
+                    break
+                else:
+                    player.send("ERROR unknown command")
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            player.closed = True
+            if player.match is not None:
+                player.match.leave()
+            writer.close()
+
+    # --- Matches ---
+    async def _matchmake(self):
+        first = None
+        while True:
+            player = await self.waiting.get()
+            if player.closed:
+                continue
+            if first is None or first.closed:
+                first = player
+                continue
+            first.queued = player.queued = False
+            asyncio.create_task(self._run_match(first, player))
+            first = None
+
+    async def _run_match(self, a, b):
+        match = Match(next(self._ids), a, b)
+        self.matches_started += 1
+        self.active_matches += 1
+        a.match, a.side = match, 0
+        b.match, b.side = match, 1
+        a.send(f"MATCHED {match.id} {b.name}")
+        b.send(f"MATCHED {match.id} {a.name}")
+        scores = match.scores
+        reason = "rounds"
+        try:
+            while not self.max_rounds or match.rounds < self.max_rounds:
+                stop = await match.next_round(self.move_timeout)
+                if stop is not None:
+                    reason = stop
+                    break
+                move_a, move_b = match.moves
+                match.moves = [None, None]
+                outcome = resolve_code(move_a, move_b)
+                if outcome == WIN_CODE:
+                    scores[0] += 1
+                elif outcome == LOSS_CODE:
+                    scores[1] += 1
+                match.rounds += 1
+                self.rounds_played += 1
+                a.send(f"RESULT {CHOICES[move_a]} {CHOICES[move_b]} {OUTCOME_NAMES[outcome]} {scores[0]} {scores[1]}")
+                b.send(f"RESULT {CHOICES[move_b]} {CHOICES[move_a]} {OUTCOME_NAMES[resolve_code(move_b, move_a)]} "
+                       f"{scores[1]} {scores[0]}")
+                await self._drain(a, b)
+        finally:
+            self.active_matches -= 1
+            for player in (a, b):
+                player.match = None
+                player.send(f"END {reason}")
+
+    @staticmethod
+    async def _drain(*players):
+        """Applies backpressure from slow clients without failing the match."""
+        for player in players:
+            if not player.closed:
+                try:
+                    await player.writer.drain()
+                except ConnectionError:
+                    player.closed = True
+
+# --- Command Line ---
+async def serve(host, port, move_timeout, max_rounds):
+    server = await MatchServer(host, port, move_timeout, max_rounds).start()
+    print(f"RPS server listening on {server.host}:{server.port}", file=sys.stderr)
+    await server.serve_forever()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the Rock-Paper-Scissors match server.")
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--move-timeout", type=float, default=MOVE_TIMEOUT, help="seconds allowed per move")
+    parser.add_argument("--max-rounds", type=int, default=0, help="rounds per match (0 = unlimited)")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.move_timeout, args.max_rounds))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
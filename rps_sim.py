@@ -0,0 +1,115 @@
+import argparse
+import random
+import sys
+import time
+from rps_core import LOSS_CODE, TIE_CODE, WIN_CODE, resolve_code
+from rps_strategies import STRATEGIES
+
+# --- Configuration ---
+BATCH_SIZE = 1 << 20  # Rounds resolved per batch
+
+# --- Lookup Tables ---
+# A pair of moves (a, b) is encoded as the byte a * 3 + b; OUTCOME_TABLE maps
+# that byte to the outcome code for player a. bytes.translate applies a table
+# to a whole batch in C, which is what "vectorized" means without numpy.
+TRIPLE_TABLE = bytes((b * 3) % 256 for b in range(256))
+OUTCOME_TABLE = bytes(((p // 3 - p % 3) % 3) if p < 9 else 0 for p in range(256))
+
+def pair_codes(a_moves, b_moves):
+    """Returns the bytes a * 3 + b for two equally long byte strings of moves.
+
+    One big-integer addition adds every byte at once: no position can exceed
+    6 + 2 = 8, so there is never a carry into the next byte.
+    """
+    n = len(a_moves)
+    total = int.from_bytes(a_moves.translate(TRIPLE_TABLE), "little") + int.from_bytes(b_moves, "little")
+    return total.to_bytes(n, "little")
+
+def score_moves(a_moves, b_moves):
+    """Resolves a batch of rounds and returns (a_wins, b_wins, ties)."""
+    if len(a_moves) != len(b_moves):
+        raise ValueError("move batches must have the same length")
+    outcomes = pair_codes(a_moves, b_moves).translate(OUTCOME_TABLE)
+    a_wins = outcomes.count(WIN_CODE)
+    b_wins = outcomes.count(LOSS_CODE)
+    return a_wins, b_wins, len(outcomes) - a_wins - b_wins
+
+# --- Simulation ---
+class MatchResult:
+    """Aggregate score of a simulated match."""
+
+    __slots__ = ("a_wins", "b_wins", "ties")
+
+    def __init__(self, a_wins=0, b_wins=0, ties=0):
+        self.a_wins = a_wins
+        self.b_wins = b_wins
+        self.ties = ties
+
+    @property
+    def rounds(self):
+        return self.a_wins + self.b_wins + self.ties
+
+    def win_rate(self):
+        """Player a's share of rounds won."""
+        return self.a_wins / self.rounds if self.rounds else 0.0
+
+    def __repr__(self):
+        return f"MatchResult(a_wins={self.a_wins}, b_wins={self.b_wins}, ties={self.ties})"
+
+
+def simulate(strategy_a, strategy_b, rounds, rng=None, batch_size=BATCH_SIZE):
+    """Plays `rounds` rounds between two strategies and returns a MatchResult.
+
+    Strategies that ignore history are resolved a whole batch at a time;
+    adaptive ones (see rps_strategies) need a choose/observe step per round.
+    """
+    rng = rng or random.Random()
+    if strategy_a.adaptive or strategy_b.adaptive:
+        return _simulate_adaptive(strategy_a, strategy_b, rounds, rng, batch_size)
+    result = MatchResult()
+    remaining = rounds
+    while remaining > 0:
+        n = min(batch_size, remaining)
+        a_wins, b_wins, ties = score_moves(strategy_a.moves(n, rng), strategy_b.moves(n, rng))
+        result.a_wins += a_wins
+        result.b_wins += b_wins
+        result.ties += ties
+        remaining -= n
+    return result
+
+def _simulate_adaptive(strategy_a, strategy_b, rounds, rng, batch_size):
+    tally = [0, 0, 0]  # indexed by outcome code: ties, a wins, b wins
+    remaining = rounds
+    while remaining > 0:
+        n = min(batch_size, remaining)
+        # A non-adaptive side still draws its moves in one batch
+        a_batch = None if strategy_a.adaptive else strategy_a.moves(n, rng)
+        b_batch = None if strategy_b.adaptive else strategy_b.moves(n, rng)
+        for i in range(n):
+            a = strategy_a.choose(rng) if a_batch is None else a_batch[i]
+            b = strategy_b.choose(rng) if b_batch is None else b_batch[i]
+            strategy_a.observe(a, b)
+            strategy_b.observe(b, a)
+            tally[resolve_code(a, b)] += 1
+        remaining -= n
+    return MatchResult(tally[WIN_CODE], tally[LOSS_CODE], tally[TIE_CODE])
+
+# --- Command Line ---
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate Rock-Paper-Scissors matches between bots.")
+    parser.add_argument("a", choices=sorted(STRATEGIES))
+    parser.add_argument("b", choices=sorted(STRATEGIES))
+    parser.add_argument("-r", "--rounds", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    result = simulate(STRATEGIES[args.a](), STRATEGIES[args.b](), args.rounds, random.Random(args.seed))
+    elapsed = time.perf_counter() - start
+    print(f"{args.a} vs {args.b}: {result.a_wins} - {result.b_wins} ({result.ties} ties), "
+          f"{args.a} wins {result.win_rate():.2%}")
+    print(f"{result.rounds} rounds in {elapsed:.3f} s ({result.rounds / elapsed:,.0f} rounds/s)")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,172 @@
+from array import array
+from collections import deque
+from rps_core import CHOICES, ROCK
+
+# --- Configuration ---
+MARKOV_ORDER = 2  # Opponent moves of context the predictor looks at
+MARKOV_WINDOW = 300  # Rounds of history the predictor remembers
+
+# Tables for drawing unbiased moves from random bytes (255 = 3 * 85 is dropped)
+MOD3_TABLE = bytes(b % 3 for b in range(256))
+MOD3_REJECT = bytes([255])
+
+# --- Interface ---
+class Strategy:
+    """A computer player. Moves are the integer codes from rps_core (0-2).
+
+    Interactive play calls `choose()` before each round and `observe()` with
+    both moves after it. Strategies that ignore history (`adaptive = False`)
+    can also produce many moves at once with `moves()`, which is what the
+    batch simulator uses.
+    """
+
+    name = "strategy"
+    adaptive = False
+
+    def choose(self, rng):
+        """Returns this strategy's next move."""
+        return self.moves(1, rng)[0]
+
+    def observe(self, own, opponent):
+        """Tells the strategy what both sides played in the last round."""
+
+    def moves(self, count, rng):
+        """Returns `count` moves as bytes (non-adaptive strategies only)."""
+        raise NotImplementedError
+
+    def reset(self):
+        """Forgets everything learned so far."""
+
+
+# --- Fixed Strategies ---
+class ConstantStrategy(Strategy):
+    def __init__(self, move=ROCK):
+        self.move = move
+        self.name = CHOICES[move].lower()
+
+    def choose(self, rng):
+        return self.move
+
+    def moves(self, count, rng):
+        return bytes([self.move]) * count
+
+
+class CycleStrategy(Strategy):
+    """Plays a fixed sequence of moves over and over."""
+
+    name = "cycle"
+
+    def __init__(self, sequence=(0, 1, 2)):
+        self.sequence = bytes(sequence)
+        self.position = 0
+
+    def moves(self, count, rng):
+        period = len(self.sequence)
+        start = self.position
+        repeated = self.sequence * ((start + count) // period + 1)
+        self.position = (start + count) % period
+        return repeated[start:start + count]
+
+    def reset(self):
+        self.position = 0
+
+
+class RandomStrategy(Strategy):
+    """Uniformly random moves, or weighted ones if `weights` (rock, paper, scissors) is given."""
+
+    name = "random"
+
+    def __init__(self, weights=None):
+        if weights is None:
+            self.table, self.rejected, self.accept_rate = MOD3_TABLE, MOD3_REJECT, 255 / 256
+        else:
+            # Spread the bytes 0-251 over the moves in proportion to the weights
+            total = sum(weights)
+            bounds = [round(252 * sum(weights[:i + 1]) / total) for i in range(3)]
+            table = [next(i for i, bound in enumerate(bounds) if b < bound) if b < 252 else 0 for b in range(256)]
+            self.table, self.rejected, self.accept_rate = bytes(table), bytes(range(252, 256)), 252 / 256
+            self.name = "biased"
+
+    def choose(self, rng):
+        return self.moves(1, rng)[0]
+
+    def moves(self, count, rng):
+        out = bytearray()
+        while len(out) < count:
+            block = rng.randbytes(int((count - len(out)) / self.accept_rate) + 16)
+            out += block.translate(self.table, self.rejected)
+        del out[count:]
+        return bytes(out)
+
+
+# --- Adaptive Strategy ---
+class MarkovStrategy(Strategy):
+    """Predicts the opponent's next move from their last `order` moves and counters it.
+
+    Counts of "after this context the opponent played that" live in a flat
+    integer array with 3 ** order * 3 entries. Only the last `window` rounds
+    are counted: each observation adds one count and drops the one that
+    fell out of the window. Both choosing and observing are O(1), and
+    memory stays bounded no matter how long the match runs.
+    """
+
+    name = "markov"
+    adaptive = True
+
+    def __init__(self, order=MARKOV_ORDER, window=MARKOV_WINDOW):
+        if order < 1 or window < 1:
+            raise ValueError("order and window must be at least 1")
+        self.order = order
+        self.window = window
+        self.contexts = 3 ** order
+        self.reset()
+
+    def reset(self):
+        self.counts = array("l", bytes(self.contexts * 3 * array("l").itemsize))
+        self.history = deque()
+        self.context = 0
+        self.seen = 0
+
+    def predict(self):
+        """Returns the opponent's most likely next move, or None without enough history."""
+        if self.seen < self.order:
+            return None
+        base = self.context * 3
+        rock, paper, scissors = self.counts[base], self.counts[base + 1], self.counts[base + 2]
+        if rock == paper == scissors:
+            return None
+        if rock >= paper and rock >= scissors:
+            return 0
+        return 1 if paper >= scissors else 2
+
+    def choose(self, rng):
+        predicted = self.predict()
+        if predicted is None:
+            return rng.randrange(3)
+        return (predicted + 1) % 3  # the move that beats the prediction
+
+    def observe(self, own, opponent):
+        if self.seen >= self.order:
+            slot = self.context * 3 + opponent
+            self.counts[slot] += 1
+            self.history.append(slot)
+            if len(self.history) > self.window:
+                self.counts[self.history.popleft()] -= 1
+        self.context = (self.context * 3 + opponent) % self.contexts
+        self.seen += 1
+
+
+# --- Registry ---
+STRATEGIES = {
+    "rock": lambda: ConstantStrategy(0),
+    "paper": lambda: ConstantStrategy(1),
+    "scissors": lambda: ConstantStrategy(2),
+    "cycle": CycleStrategy,
+    "random": RandomStrategy,
+    "biased": lambda: RandomStrategy((0.5, 0.3, 0.2)),
+    "markov": MarkovStrategy,
+}
+
+def make_strategy(name):
+    """Creates a registered strategy by name."""
+    return STRATEGIES[name]()
@@ -0,0 +1,220 @@
+import argparse
+import csv
+import math
+import os
+import random
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import combinations
+from rps_sim import simulate
+from rps_strategies import STRATEGIES, make_strategy
+
+# --- Configuration ---
+RESULT_FIELDS = ["a", "b", "repeat", "rounds", "seed", "a_wins", "b_wins", "ties"]
+COUNT_FIELDS = ["repeat", "rounds", "a_wins", "b_wins", "ties"]
+INFLIGHT_PER_WORKER = 2  # Matches queued per worker
+Z_95 = 1.959964  # Normal quantile for 95% confidence intervals
+
+# --- Matches ---
+def match_seed(seed, a, b, repeat):
+    """Derives a match's seed from the tournament seed, so reruns and resumes are reproducible."""
+    return f"{seed}:{a}:{b}:{repeat}"
+
+def play_match(a, b, repeat, rounds, seed):
+    """Runs in a worker process: plays one match and returns its result row."""
+    rng = random.Random(match_seed(seed, a, b, repeat))
+    result = simulate(make_strategy(a), make_strategy(b), rounds, rng)
+    return {"a": a, "b": b, "repeat": repeat, "rounds": rounds, "seed": str(seed),
+            "a_wins": result.a_wins, "b_wins": result.b_wins, "ties": result.ties}
+
+def match_key(a, b, repeat):
+    """Identifies a match whichever side each strategy played on."""
+    a, b = sorted((a, b))
+    return a, b, repeat
+
+def schedule(names, repeats):
+    """Yields (a, b, repeat) for every round-robin pairing."""
+    for repeat in range(repeats):
+        for a, b in combinations(names, 2):
+            yield a, b, repeat
+
+# --- Leaderboard ---
+def wilson_interval(wins, total, z=Z_95):
+    """Returns the Wilson score interval (low, high) for a win proportion."""
+    if total == 0:
+        return 0.0, 1.0
+    p = wins / total
+    center = (p + z * z / (2 * total)) / (1 + z * z / total)
+    margin = z * math.sqrt(p * (1 - p) / total + z * z / (4 * total * total)) / (1 + z * z / total)
+    return max(0.0, center - margin), min(1.0, center + margin)
+
+class Leaderboard:
+    """Running per-strategy totals; results can be added in any order."""
+
+    def __init__(self):
+        self.totals = {}
+
+    def add(self, row):
+        a, b = row["a"], row["b"]
+        a_wins, b_wins, ties = int(row["a_wins"]), int(row["b_wins"]), int(row["ties"])
+        for name, wins, losses in ((a, a_wins, b_wins), (b, b_wins, a_wins)):
+            total = self.totals.setdefault(name, [0, 0, 0])
+            total[0] += wins
+            total[1] += losses
+            total[2] += ties
+
+    def standings(self):
+        """Returns rows of (name, wins, losses, ties, win_rate, ci_low, ci_high), best first."""
+        rows = []
+        for name, (wins, losses, ties) in self.totals.items():
+            rounds = wins + losses + ties
+            low, high = wilson_interval(wins, rounds)
+            rows.append((name, wins, losses, ties, wins / rounds if rounds else 0.0, low, high))
+        rows.sort(key=lambda row: row[4], reverse=True)
+        return rows
+
+    def write_csv(self, path):
+        with open(path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["strategy", "wins", "losses", "ties", "win_rate", "ci95_low", "ci95_high"])
+            for name, wins, losses, ties, rate, low, high in self.standings():
+                writer.writerow([name, wins, losses, ties, f"{rate:.6f}", f"{low:.6f}", f"{high:.6f}"])
+
+    def print(self, out=sys.stdout):
+        out.write(f"{'strategy':<12}{'win rate':>10}{'95% CI':>20}{'wins':>12}{'losses':>12}{'ties':>12}\n")
+        for name, wins, losses, ties, rate, low, high in self.standings():
+            out.write(f"{name:<12}{rate:>10.2%}{f'{low:.2%} - {high:.2%}':>20}{wins:>12}{losses:>12}{ties:>12}\n")
+
+# --- Tournament ---
+def load_checkpoint(path):
+    """Returns (rows, size): the result rows already written to `path` (an interrupted run).
+
+    `size` is the byte length of the header and the complete rows. A row
+    torn by a crash, and anything after it, is left out of both.
+    """
+    if not os.path.exists(path):
+        return [], 0
+    rows = []
+    with open(path, "rb") as file:
+        header = file.readline()
+        if not header.endswith(b"\n"):
+            return [], 0
+        fields = next(csv.reader([header.decode("utf-8")]))
+        if fields != RESULT_FIELDS:
+            raise ValueError(f"{path} has columns {', '.join(fields)}, not a results file of this version")
+        size = len(header)
+        for line in file:
+            if not line.endswith(b"\n"):
+                break
+            values = next(csv.reader([line.decode("utf-8")]), [])
+            if len(values) != len(RESULT_FIELDS):
+                break
+            row = dict(zip(RESULT_FIELDS, values))
+            try:
+                for field in COUNT_FIELDS:
+                    int(row[field])
+            except ValueError:
+                break
+            rows.append(row)
+            size += len(line)
+    return rows, size
+
+def run_tournament(names, rounds, results_path, repeats=1, workers=1, seed=0, progress=None):
+    """Plays a round-robin tournament and returns its Leaderboard.
+
+    Each finished match is appended to `results_path` and flushed right away,
+    so the file is both the result file and the checkpoint: rerunning with
+    the same arguments skips the matches it already holds (in whichever order
+    the strategies are listed). Rows carry the rounds and seed they were
+    played with; resuming with different ones, or from a file holding
+    matches that aren't part of this run, raises ValueError rather than
+    mixing results.
+    """
+    unknown = [name for name in names if name not in STRATEGIES]
+    if unknown:
+        raise ValueError(f"unknown strategies: {', '.join(unknown)}")
+
+    leaderboard = Leaderboard()
+    done = set()
+    rows, size = load_checkpoint(results_path)
+    scheduled = {match_key(*match) for match in schedule(names, repeats)}
+    for row in rows:
+        if int(row["rounds"]) != rounds or row["seed"] != str(seed):
+            raise ValueError(f"{results_path} holds matches played with --rounds {row['rounds']} "
+                             f"--seed {row['seed']}; pass another --results file to start a new run")
+        key = match_key(row["a"], row["b"], int(row["repeat"]))
+        if key not in scheduled:
+            raise ValueError(f"{results_path} holds {row['a']} vs {row['b']} #{row['repeat']}, which isn't "
+                             "part of this run; pass another --results file to start a new run")
+        if key not in done:
+            done.add(key)
+            leaderboard.add(row)
+    todo = (match for match in schedule(names, repeats) if match_key(*match) not in done)
+
+    if os.path.exists(results_path) and os.path.getsize(results_path) > size:
+        # Drop a row torn by a crash, so new rows don't get appended onto it
+        os.truncate(results_path, size)
+    with open(results_path, "a", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=RESULT_FIELDS)
+        if size == 0:
+            writer.writeheader()
+
+        def record(row):
+            writer.writerow(row)
+            file.flush()
+            leaderboard.add(row)
+            if progress is not None:
+                progress(row)
+
+        if workers <= 1:
+            for a, b, repeat in todo:
+                record(play_match(a, b, repeat, rounds, seed))
+            return leaderboard
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = set()
+            for a, b, repeat in todo:
+                pending.add(executor.submit(play_match, a, b, repeat, rounds, seed))
+                if len(pending) >= workers * INFLIGHT_PER_WORKER:
+                    break
+            while pending:
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    record(future.result())
+                    match = next(todo, None)
+                    if match is not None:
+                        pending.add(executor.submit(play_match, *match, rounds, seed))
+    return leaderboard
+
+# --- Command Line ---
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Round-robin tournament between RPS strategies.")
+    parser.add_argument("strategies", nargs="*", default=sorted(STRATEGIES),
+                        help=f"strategies to enter (default: all of {', '.join(sorted(STRATEGIES))})")
+    parser.add_argument("-r", "--rounds", type=int, default=100_000, help="rounds per match")
+    parser.add_argument("--repeats", type=int, default=1, help="times every pairing is played")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", default="0", help="tournament seed (match seeds derive from it)")
+    parser.add_argument("-o", "--results", default="tournament_results.csv",
+                        help="per-match results; also the checkpoint an interrupted run resumes from")
+    parser.add_argument("--leaderboard", help="also write the final leaderboard as CSV")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    try:
+        leaderboard = run_tournament(
+            args.strategies, args.rounds, args.results, args.repeats, args.workers, args.seed,
+            progress=lambda row: print(f"{row['a']} vs {row['b']} #{row['repeat']}: "
+                                       f"{row['a_wins']}-{row['b_wins']} ({row['ties']} ties)", file=sys.stderr),
+        )
+    except ValueError as error:
+        parser.error(str(error))
+    print(f"finished in {time.perf_counter() - start:.1f} s\n", file=sys.stderr)
+    leaderboard.print()
+    if args.leaderboard:
+        leaderboard.write_csv(args.leaderboard)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
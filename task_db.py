@@ -0,0 +1,160 @@
+import os
+import sqlite3
+from task_journal import TaskJournal
+from task_store import TaskStore
+
+# --- Configuration ---
+FETCH_SIZE = 5000  # Rows fetched per streamed batch
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id      INTEGER PRIMARY KEY,
+    text    TEXT NOT NULL,
+    done    INTEGER NOT NULL DEFAULT 0,
+    created REAL,
+    updated REAL
+);
+CREATE INDEX IF NOT EXISTS tasks_done ON tasks (done);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+# The trigram tokenizer (SQLite 3.34+) lets MATCH find any substring of 3+ characters
+FTS_SCHEMA = "CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(text, tokenize='trigram')"
+
+# --- Statements (kept as constants so sqlite3's statement cache reuses them) ---
+INSERT_TASK = "INSERT INTO tasks (id, text, done, created, updated) VALUES (?, ?, ?, ?, ?)"
+INSERT_FTS = "INSERT INTO tasks_fts (rowid, text) VALUES (?, ?)"
+DELETE_TASK = "DELETE FROM tasks WHERE id = ?"
+DELETE_FTS = "DELETE FROM tasks_fts WHERE rowid = ?"
+MARK_DONE = "UPDATE tasks SET done = 1, updated = ? WHERE id = ? AND done = 0"
+SELECT_TASKS = "SELECT id, text, done, created, updated FROM tasks ORDER BY id"
+SEARCH_FTS = "SELECT rowid FROM tasks_fts WHERE tasks_fts MATCH ? ORDER BY rowid"
+SEARCH_LIKE = "SELECT id FROM tasks WHERE text LIKE ? ESCAPE '\\' ORDER BY id"
+
+
+class TaskDatabase:
+    """SQLite storage for tasks, a drop-in alternative to TaskJournal.
+
+    It takes the same edit records as the journal (using their task ids),
+    writes each call to `append()` in a single transaction, runs in WAL mode,
+    and keeps an FTS5 trigram index so `search()` needs no table scan. On
+    first use it imports an existing `tasks.txt` (and its journal) once.
+    """
+
+    def __init__(self, path, text_path=None):
+        self.path = path
+        self.text_path = text_path
+        self.conn = None
+        self.fts = False
+
+    def open(self):
+        if self.conn is not None:
+            return
+        # Edits may be written from todo_app's background writer thread
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        try:
+            self.conn.execute(FTS_SCHEMA)
+            self.fts = True
+        except sqlite3.OperationalError:
+            # Older SQLite without FTS5/trigram: search() falls back to LIKE
+            self.fts = False
+        if self.text_path is not None:
+            self.migrate_from_text(self.text_path)
+
+    # --- Loading ---
+    def load(self):
+        """Returns a TaskStore with every task in the database."""
+        store = TaskStore()
+        for _ in self.stream(store):
+            pass
+        return store
+
+    def stream(self, store, fetch_size=FETCH_SIZE):
+        """Loads tasks into `store` in batches of `fetch_size`, yielding each batch."""
+        self.open()
+        cursor = self.conn.execute(SELECT_TASKS)
+        while True:
+            rows = cursor.fetchmany(fetch_size)
+            if not rows:
+                break
+            batch = []
+            for task_id, text, done, created, updated in rows:
+                task = store.add(text, bool(done), created, task_id)
+                task.updated = updated
+                batch.append(task)
+            yield batch
+
+    def pending_records(self):
+        """Nothing to replay: every edit is applied to the database directly."""
+        return []
+
+    # --- Writing ---
+    def append(self, records):
+        """Applies edit records in one transaction, batching runs of inserts."""
+        self.open()
+        with self.conn:
+            adds = []
+            for record in records:
+                if record[0] == "add":
+                    adds.append(record)
+                    continue
+                if adds:
+                    self._insert(adds)
+                    adds = []
+                op = record[0]
+                if op == "del":
+                    self.conn.execute(DELETE_TASK, (record[2],))
+                    if self.fts:
+                        self.conn.execute(DELETE_FTS, (record[2],))
+                elif op == "done":
+                    self.conn.execute(MARK_DONE, (record[2], record[3]))
+                elif op == "clear":
+                    self.conn.execute("DELETE FROM tasks")
+                    if self.fts:
+                        self.conn.execute("DELETE FROM tasks_fts")
+            if adds:
+                self._insert(adds)
+
+    def _insert(self, adds):
+        # ["add", text, created, id]
+        self.conn.executemany(INSERT_TASK, [(r[3], r[1], 0, r[2], r[2]) for r in adds])
+        if self.fts:
+            self.conn.executemany(INSERT_FTS, [(r[3], r[1]) for r in adds])
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+    # --- Queries ---
+    def search(self, query):
+        """Returns the ids of tasks whose text contains `query` (case-insensitive), in order."""
+        self.open()
+        if self.fts and len(query) >= 3:
+            rows = self.conn.execute(SEARCH_FTS, ('"' + query.replace('"', '""') + '"',))
+        else:
+            pattern = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            rows = self.conn.execute(SEARCH_LIKE, (f"%{pattern}%",))
+        return [row[0] for row in rows]
+
+    # --- Migration ---
+    def migrate_from_text(self, text_path):
+        """Imports `tasks.txt` (and its journal) once, if the database is still empty."""
+        migrated = self.conn.execute("SELECT value FROM meta WHERE key = 'migrated_from'").fetchone()
+        if migrated is not None or not os.path.exists(text_path):
+            return 0
+        if self.conn.execute("SELECT 1 FROM tasks LIMIT 1").fetchone() is not None:
+            return 0
+
+        journal = TaskJournal(text_path)
+        store = journal.load()
+        journal.close()
+        with self.conn:
+            self.conn.executemany(INSERT_TASK, [(t.id, t.text, int(t.done), t.created, t.updated) for t in store])
+            if self.fts:
+                self.conn.executemany(INSERT_FTS, [(t.id, t.text) for t in store])
+            self.conn.execute("INSERT INTO meta (key, value) VALUES ('migrated_from', ?)", (os.path.abspath(text_path),))
+        return len(store)
@@ -0,0 +1,124 @@
+import csv
+import json
+import os
+from task_store import parse_line
+
+# --- Configuration ---
+CSV_FIELDS = ["text", "done", "created", "updated"]
+TRUE_VALUES = {"1", "true", "yes", "y", "x", "done"}
+
+# --- Readers (each yields (text, done, created) one row at a time) ---
+def _parse_time(value):
+    return float(value) if value not in (None, "") else None
+
+def read_csv(file):
+    """Streams rows from a CSV file with at least a "text" column."""
+    reader = csv.reader(file)
+    header = next(reader, None)
+    if header is None or "text" not in header:
+        raise ValueError("CSV needs a header row with a 'text' column")
+    # Plain rows indexed by column are much cheaper than a dict per row
+    text_col = header.index("text")
+    done_col = header.index("done") if "done" in header else None
+    created_col = header.index("created") if "created" in header else None
+    try:
+        for row in reader:
+            if len(row) <= text_col or not row[text_col].strip():
+                continue
+            done = done_col is not None and done_col < len(row) and row[done_col].strip().lower() in TRUE_VALUES
+            try:
+                created = _parse_time(row[created_col]) if created_col is not None and created_col < len(row) else None
+            except ValueError:
+                raise ValueError(f"line {reader.line_num}: bad 'created' value {row[created_col]!r}") from None
+            yield row[text_col], done, created
+    except csv.Error as error:
+        raise ValueError(f"line {reader.line_num}: {error}") from None
+
+def read_jsonl(file):
+    """Streams rows from JSON Lines: objects with a "text" key, or plain strings."""
+    decode = json.JSONDecoder().raw_decode  # Skips json.loads' per-call wrapper layers
+    for number, line in enumerate(file, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            item = decode(line)[0]
+            if isinstance(item, str):
+                text, done, created = item, False, None
+            else:
+                text, done, created = item["text"], bool(item.get("done", False)), _parse_time(item.get("created"))
+            if not isinstance(text, str):
+                raise TypeError(text)
+        except (ValueError, KeyError, TypeError, AttributeError):
+            raise ValueError(f"line {number}: expected a JSON string or an object with 'text'") from None
+        if text.strip():
+            yield text, done, created
+
+def clean_text(text):
+    """Returns (text, done) the way tasks.txt would read the text back.
+
+    The snapshot holds one task per line with a trailing [DONE] meaning done,
+    so line breaks become spaces and a trailing marker becomes the done flag;
+    otherwise the task would come back differently after a compaction.
+    """
+    text = text.replace("\r\n", " ").replace("\r", " ").replace("\n", " ").strip()
+    return parse_line(text)
+
+# --- Writers ---
+def write_csv(tasks, file):
+    writer = csv.writer(file)
+    writer.writerow(CSV_FIELDS)
+    writer.writerows((task.text, int(task.done), task.created, task.updated) for task in tasks)
+
+def write_jsonl(tasks, file):
+    for task in tasks:
+        file.write(json.dumps({"text": task.text, "done": task.done, "created": task.created,
+                               "updated": task.updated}, ensure_ascii=False) + "\n")
+
+FORMATS = {".csv": (read_csv, write_csv), ".jsonl": (read_jsonl, write_jsonl), ".ndjson": (read_jsonl, write_jsonl)}
+
+def _format(path):
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in FORMATS:
+        raise ValueError(f"unsupported file type {extension!r} (use .csv or .jsonl)")
+    return FORMATS[extension]
+
+# --- Bulk Operations ---
+def import_tasks(path, store):
+    """Streams every task in a CSV or JSONL file into `store`.
+
+    Returns (tasks, records): the new tasks, and the storage records that
+    persist them in one `append()` call. Text is normalized by `clean_text`. If a row is bad, the tasks added
+    so far are removed again and ValueError is raised; any other error
+    (e.g. an OSError halfway through the file) also removes them before
+    it propagates, so the store never holds tasks without records.
+    """
+    read, _ = _format(path)
+    start = len(store)
+    records = []
+    done_records = []
+    try:
+        with open(path, "r", encoding="utf-8", newline="") as file:
+            for text, done, created in read(file):
+                text, marked = clean_text(text)
+                if not text:
+                    continue
+                done = done or marked
+                task = store.add(text, False, created)
+                records.append(["add", task.text, task.created, task.id])
+                if done:
+                    # Added as pending + "done" so both backends store the flag
+                    store.mark_done(len(store) - 1, task.created)
+                    done_records.append(["done", len(store) - 1, task.updated, task.id])
+    except BaseException:
+        store.delete_many(range(start, len(store)))
+        raise
+    return store[start:], records + done_records
+
+def export_tasks(path, tasks):
+    """Writes tasks to a CSV or JSONL file (by extension), streaming row by row."""
+    _, write = _format(path)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8", newline="") as file:
+        write(tasks, file)
+    os.replace(tmp_path, path)
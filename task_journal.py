@@ -0,0 +1,236 @@
+import json
+import os
+import threading
+import zlib
+from task_store import TaskStore
+
+# --- Configuration ---
+COMPACT_THRESHOLD = 1024 * 1024  # Journal size in bytes that triggers a compaction
+CHUNK_SIZE = 64 * 1024  # Bytes read from the snapshot per streamed batch
+
+# --- Helpers ---
+def replay(store, records):
+    """Applies journal records, in order, to a TaskStore."""
+    for record in records:
+        # "seal" records are dropped by read_journal, everything else is an edit
+        store.apply(record)
+    return store
+
+def iter_snapshot(path, chunk_size=CHUNK_SIZE):
+    """Yields (lines, crc) batches, reading the snapshot `chunk_size` bytes at a time.
+
+    `crc` is the running CRC of everything read so far, so the last batch
+    carries the CRC of the whole file.
+    """
+    if not os.path.exists(path):
+        return
+    crc = 0
+    tail = b""
+    with open(path, "rb") as file:
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                break
+            crc = zlib.crc32(chunk, crc)
+            block = tail + chunk
+            cut = block.rfind(b"\n") + 1
+            tail = block[cut:]
+            if cut:
+                lines = block[:cut - 1].decode("utf-8").split("\n")
+                yield [line.strip() for line in lines], crc
+    if tail:
+        yield [tail.decode("utf-8").strip()], crc
+
+def read_snapshot(path):
+    """Reads the snapshot file and returns its lines plus the CRC of its contents."""
+    lines, crc = [], 0
+    for batch, crc in iter_snapshot(path):
+        lines.extend(batch)
+    return lines, crc
+
+def read_journal(path):
+    """Reads a journal file and returns (seal_crc, records, good_size).
+
+    A torn last line left behind by a crash is ignored, as is anything after
+    it; `good_size` is the byte length of the intact records before it.
+    """
+    seal, records, good_size = None, [], 0
+    if not os.path.exists(path):
+        return seal, records, good_size
+    with open(path, "rb") as file:
+        for line in file:
+            # A record only counts once its newline made it to disk
+            if not line.endswith(b"\n"):
+                break
+            try:
+                record = json.loads(line)
+            except ValueError:
+                break
+            if record[0] == "seal":
+                seal = record[1]
+            else:
+                records.append(record)
+            good_size += len(line)
+    return seal, records, good_size
+
+def _fsync_dir(path):
+    """Makes a rename inside `path` durable (no-op where directories can't be opened)."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+# --- Journal ---
+class TaskJournal:
+    """Append-only task storage on top of the plain `tasks.txt` snapshot.
+
+    Every edit is appended to `<snapshot>.journal` as one JSON record:
+    `["add", text, created, id]`, `["del", index, id]`, `["done", index, when, id]`
+    or `["clear"]`. Indexes are list positions at the time of the edit and are
+    what replay uses; ids are only meaningful to the SQLite backend. Once the
+    journal grows past `threshold` bytes it is sealed, renamed to
+    `<snapshot>.journal.old` and folded into a fresh snapshot on a background
+    thread (written to a temp file, fsynced, then atomically renamed in place).
+    The seal records the CRC of the snapshot the old journal applies to, so a
+    crash between the rename and the cleanup can't replay it twice.
+    """
+
+    def __init__(self, path, threshold=COMPACT_THRESHOLD):
+        self.path = path
+        self.journal_path = path + ".journal"
+        self.frozen_path = path + ".journal.old"
+        self.threshold = threshold
+        self._lock = threading.Lock()
+        self._file = None
+        self._size = 0
+        self._base_crc = 0
+        self._compactor = None
+
+    def load(self):
+        """Returns a TaskStore with the current tasks (snapshot + journal replay)."""
+        store = TaskStore()
+        for _ in self.stream(store):
+            pass
+        return replay(store, self.pending_records())
+
+    def stream(self, store, chunk_size=CHUNK_SIZE):
+        """Loads the snapshot into `store` batch by batch, yielding each batch of new tasks.
+
+        The file is read `chunk_size` bytes at a time, never all at once. Once the
+        generator is exhausted, `pending_records()` returns the journal records
+        that still have to be replayed on top of the streamed tasks.
+        """
+        self._base_crc = 0
+        for batch, self._base_crc in iter_snapshot(self.path, chunk_size):
+            yield store.extend_lines(batch)
+
+    def pending_records(self):
+        """Returns the journal records to replay after `stream()` and opens the journal."""
+        records = []
+        fold_pending = False
+        if os.path.exists(self.frozen_path):
+            seal, frozen, _ = read_journal(self.frozen_path)
+            if seal is None or seal == self._base_crc:
+                records.extend(frozen)
+                fold_pending = True
+            else:
+                # Already folded into the snapshot before a crash; just clean up
+                os.remove(self.frozen_path)
+        _, active, good_size = read_journal(self.journal_path)
+        records.extend(active)
+        # Cut off a torn tail so new records don't get glued onto it
+        self._open(truncate=good_size)
+        if fold_pending:
+            self._start_compaction()
+        return records
+
+    def append(self, records):
+        """Durably appends records to the journal (one write and one fsync).
+
+        If the write or fsync fails, the journal is cut back to where it was,
+        so a retry of the same records can't duplicate or tear them.
+        """
+        data = "".join(json.dumps(record, separators=(",", ":")) + "\n" for record in records)
+        data = data.encode("utf-8")
+        with self._lock:
+            try:
+                self._file.write(data)
+                self._file.flush()
+                os.fsync(self._file.fileno())
+            except BaseException:
+                self._rollback()
+                raise
+            self._size += len(data)
+            if self._size >= self.threshold and self._compactor is None:
+                self._freeze()
+                self._start_compaction()
+
+    def close(self):
+        """Waits for a running compaction and closes the journal file."""
+        compactor = self._compactor
+        if compactor is not None:
+            compactor.join()
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    # --- Internals ---
+    def _open(self, truncate=None):
+        self._file = open(self.journal_path, "ab")
+        if truncate is not None and self._file.tell() > truncate:
+            self._file.truncate(truncate)
+            os.fsync(self._file.fileno())
+            self._file.seek(0, os.SEEK_END)
+        self._size = self._file.tell()
+
+    def _rollback(self):
+        """Drops whatever a failed append left in the journal (lock held)."""
+        try:
+            # Close flushes or drops what is left in the buffer; the truncate below removes it either way
+            self._file.close()
+        except OSError:
+            pass
+        self._open(truncate=self._size)
+
+    def _freeze(self):
+        """Seals the active journal and moves it aside for compaction (lock held)."""
+        seal = json.dumps(["seal", self._base_crc]) + "\n"
+        self._file.write(seal.encode("utf-8"))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        os.replace(self.journal_path, self.frozen_path)
+        _fsync_dir(os.path.dirname(os.path.abspath(self.path)))
+        self._open()
+
+    def _start_compaction(self):
+        self._compactor = threading.Thread(target=self._compact, daemon=True)
+        self._compactor.start()
+
+    def _compact(self):
+        """Folds the frozen journal into a new snapshot file."""
+        lines, _ = read_snapshot(self.path)
+        store = TaskStore()
+        store.extend_lines(lines)
+        replay(store, read_journal(self.frozen_path)[1])
+        data = "".join(line + "\n" for line in store.lines()).encode("utf-8")
+
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "wb") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, self.path)
+        _fsync_dir(os.path.dirname(os.path.abspath(self.path)))
+        os.remove(self.frozen_path)
+
+        with self._lock:
+            self._base_crc = zlib.crc32(data)
+            self._compactor = None
@@ -0,0 +1,83 @@
+import threading
+
+# --- Configuration ---
+GRAM = 3  # Substrings this long are indexed; shorter queries fall back to a scan
+
+def trigrams(text):
+    return {text[i:i + GRAM] for i in range(len(text) - GRAM + 1)}
+
+
+class TrigramIndex:
+    """Case-insensitive substring search over task text.
+
+    Every 3-character substring of a task's (casefolded) text maps to the
+    ids of the tasks containing it. A query intersects the posting sets of
+    its own trigrams, smallest first, and only the few candidates left are
+    checked with a real substring test. The index is updated per task on
+    add and delete; marking a task done doesn't change its text.
+
+    A lock makes it safe to search from a worker thread while the Tk
+    thread keeps adding and deleting tasks.
+    """
+
+    def __init__(self):
+        self._postings = {}
+        self._tasks = {}  # id -> (casefolded text, Task)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._tasks)
+
+    def add(self, tasks):
+        with self._lock:
+            for task in tasks:
+                text = task.text.casefold()
+                self._tasks[task.id] = (text, task)
+                for gram in trigrams(text):
+                    posting = self._postings.get(gram)
+                    if posting is None:
+                        self._postings[gram] = {task.id}
+                    else:
+                        posting.add(task.id)
+
+    def remove(self, tasks):
+        with self._lock:
+            for task in tasks:
+                text, _ = self._tasks.pop(task.id)
+                for gram in trigrams(text):
+                    posting = self._postings[gram]
+                    posting.discard(task.id)
+                    if not posting:
+                        del self._postings[gram]
+
+    def clear(self):
+        with self._lock:
+            self._postings.clear()
+            self._tasks.clear()
+
+    def rebuild(self, tasks):
+        self.clear()
+        self.add(tasks)
+
+    def search(self, query):
+        """Returns the tasks whose text contains `query`, in list order."""
+        query = query.casefold()
+        with self._lock:
+            if len(query) < GRAM:
+                ids = [task_id for task_id, (text, _) in self._tasks.items() if query in text]
+            else:
+                postings = []
+                for gram in trigrams(query):
+                    posting = self._postings.get(gram)
+                    if posting is None:
+                        return []
+                    postings.append(posting)
+                postings.sort(key=len)
+                candidates = postings[0].intersection(*postings[1:])
+                if len(query) == GRAM:
+                    ids = list(candidates)
+                else:
+                    ids = [task_id for task_id in candidates if query in self._tasks[task_id][0]]
+            # Ids grow with list position, so sorting them restores list order
+            ids.sort()
+            return [self._tasks[task_id][1] for task_id in ids]
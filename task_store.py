@@ -0,0 +1,172 @@
+import time
+from bisect import bisect_left
+
+# --- Configuration ---
+DONE_MARKER = "[DONE]"
+SMALL_BATCH = 64  # Batch deletes up to this size pop tasks one by one
+
+# --- Helpers ---
+def parse_line(line):
+    """Splits a `tasks.txt` line into its text and done flag."""
+    if line.endswith(DONE_MARKER):
+        return line[:-len(DONE_MARKER)].rstrip(), True
+    return line, False
+
+# --- Model ---
+class Task:
+    """One to-do item. Slots keep large lists compact in memory."""
+
+    __slots__ = ("id", "text", "done", "created", "updated")
+
+    def __init__(self, task_id, text, done=False, created=None, updated=None):
+        self.id = task_id
+        self.text = text
+        self.done = done
+        self.created = created
+        self.updated = updated if updated is not None else created
+
+    def label(self):
+        """Returns the text shown in the list (and written to `tasks.txt`)."""
+        return f"{self.text} {DONE_MARKER}" if self.done else self.text
+
+    def __repr__(self):
+        return f"Task({self.id!r}, {self.label()!r})"
+
+
+class TaskStore:
+    """Ordered, in-memory collection of tasks with lookups by id and status.
+
+    Tasks are only ever appended, so ids increase with position and
+    `index_of` can binary search them. The status indexes are dicts used
+    as insertion-ordered sets, which keeps "pending only" in list order
+    and makes the counts O(1).
+    """
+
+    def __init__(self):
+        self._tasks = []
+        self._ids = []
+        self._by_id = {}
+        self._pending = {}
+        self._done = {}
+        self.next_id = 1
+
+    def __len__(self):
+        return len(self._tasks)
+
+    def __getitem__(self, index):
+        return self._tasks[index]
+
+    def __iter__(self):
+        return iter(self._tasks)
+
+    # --- Queries ---
+    def get(self, task_id):
+        return self._by_id.get(task_id)
+
+    def index_of(self, task_id):
+        """Returns the position of a task in the list (ValueError if unknown)."""
+        index = bisect_left(self._ids, task_id)
+        if index == len(self._ids) or self._ids[index] != task_id:
+            raise ValueError(f"unknown task id: {task_id}")
+        return index
+
+    def pending(self):
+        return list(self._pending.values())
+
+    def done(self):
+        return list(self._done.values())
+
+    def count_pending(self):
+        return len(self._pending)
+
+    def count_done(self):
+        return len(self._done)
+
+    def lines(self):
+        """Yields every task in the plain `tasks.txt` format."""
+        for task in self._tasks:
+            yield task.label()
+
+    # --- Updates ---
+    def add(self, text, done=False, created=None, task_id=None):
+        """Appends a task and returns it."""
+        if task_id is None:
+            task_id = self.next_id
+        elif self._ids and task_id <= self._ids[-1]:
+            raise ValueError(f"task ids must increase: {task_id}")
+        if created is None:
+            created = time.time()
+        task = Task(task_id, text, done, created)
+        self.next_id = task_id + 1
+        self._tasks.append(task)
+        self._ids.append(task_id)
+        self._by_id[task_id] = task
+        (self._done if done else self._pending)[task_id] = task
+        return task
+
+    def extend_lines(self, lines, created=None):
+        """Appends tasks parsed from `tasks.txt` lines and returns them."""
+        added = []
+        for line in lines:
+            text, done = parse_line(line)
+            added.append(self.add(text, done, created))
+        return added
+
+    def delete(self, index):
+        """Removes the task at `index` and returns it."""
+        task = self._tasks.pop(index)
+        del self._ids[index]
+        del self._by_id[task.id]
+        (self._done if task.done else self._pending).pop(task.id)
+        return task
+
+    def mark_done(self, index, when=None):
+        """Marks the task at `index` as done; returns False if it already was."""
+        task = self._tasks[index]
+        if task.done:
+            return False
+        task.done = True
+        task.updated = when if when is not None else time.time()
+        del self._pending[task.id]
+        self._done[task.id] = task
+        return True
+
+    def delete_many(self, indexes):
+        """Removes the tasks at `indexes` in one pass and returns them, in list order."""
+        drop = set(indexes)
+        if len(drop) <= SMALL_BATCH:
+            # A few pops (memmoves) beat rebuilding every list
+            return [self.delete(index) for index in sorted(drop, reverse=True)][::-1]
+        removed = [self._tasks[index] for index in sorted(drop)]
+        self._tasks = [task for i, task in enumerate(self._tasks) if i not in drop]
+        self._ids = [task.id for task in self._tasks]
+        for task in removed:
+            del self._by_id[task.id]
+            (self._done if task.done else self._pending).pop(task.id)
+        return removed
+
+    def mark_done_many(self, indexes, when=None):
+        """Marks the tasks at `indexes` as done; returns the indexes that changed."""
+        if when is None:
+            when = time.time()
+        return [index for index in sorted(set(indexes)) if self.mark_done(index, when)]
+
+    def clear(self):
+        self._tasks.clear()
+        self._ids.clear()
+        self._by_id.clear()
+        self._pending.clear()
+        self._done.clear()
+
+    def apply(self, record):
+        """Applies one journal record (see `TaskJournal`), positionally."""
+        op = record[0]
+        if op == "add":
+            text, done = parse_line(record[1])
+            self.add(text, done, record[2] if len(record) > 2 else None)
+        elif op == "del":
+            self.delete(record[1])
+        elif op == "done":
+            self.mark_done(record[1], record[2] if len(record) > 2 else None)
+        elif op == "clear":
+            self.clear()
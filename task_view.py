@@ -0,0 +1,170 @@
+import tkinter as tk
+
+# --- Configuration ---
+DONE_COLOR = "gray"
+
+# --- Views ---
+class TaskListView:
+    """Keeps one Listbox row per task (the classic, full view).
+
+    `rows` is the sequence of Task objects being shown: the TaskStore itself
+    or a filtered list of its tasks.
+    """
+
+    def __init__(self, listbox, rows):
+        self.listbox = listbox
+        self.rows = rows
+
+    def append(self, tasks):
+        """Adds rows for tasks that were appended to the end of `rows`."""
+        if not tasks:
+            return
+        start = self.listbox.size()
+        self.listbox.insert(tk.END, *[task.label() for task in tasks])
+        for offset, task in enumerate(tasks):
+            # If a task was marked as done previously, make it gray
+            if task.done:
+                self.listbox.itemconfig(start + offset, {'fg': DONE_COLOR})
+
+    def delete(self, index):
+        self.listbox.delete(index)
+
+    def delete_many(self, indexes):
+        """Removes the rows at `indexes` (positions before the delete)."""
+        for index in sorted(indexes, reverse=True):
+            self.listbox.delete(index)
+
+    def update(self, index):
+        """Redraws the row of a task that changed."""
+        task = self.rows[index]
+        self.listbox.delete(index)
+        self.listbox.insert(index, task.label())
+        if task.done:
+            self.listbox.itemconfig(index, {'fg': DONE_COLOR})
+
+    def update_many(self, indexes):
+        for index in indexes:
+            self.update(index)
+
+    def clear(self):
+        self.listbox.delete(0, tk.END)
+
+    def set_rows(self, rows):
+        """Switches to another sequence of tasks and rebuilds every row."""
+        self.rows = rows
+        self.clear()
+        self.append(rows)
+
+    def selected_task(self):
+        """Returns the selected Task (IndexError if none is selected)."""
+        return self.rows[self.listbox.curselection()[0]]
+
+    def selected_tasks(self):
+        """Returns every selected Task, top to bottom (IndexError if none is selected)."""
+        selection = self.listbox.curselection()
+        if not selection:
+            raise IndexError("no task selected")
+        return [self.rows[row] for row in selection]
+
+
+class VirtualTaskListView:
+    """Builds Listbox rows only for the tasks that are currently visible.
+
+    The Listbox always holds at most `height` rows; scrolling re-fills them
+    from `rows` and the scrollbar is driven by hand, so the cost of a
+    redraw doesn't depend on how many tasks there are.
+    """
+
+    def __init__(self, listbox, scrollbar, rows):
+        self.listbox = listbox
+        self.scrollbar = scrollbar
+        self.rows = rows
+        self.height = int(listbox.cget("height"))
+        self.first = 0
+
+        self.listbox.config(yscrollcommand="")
+        self.scrollbar.config(command=self.yview)
+        self.listbox.bind("<MouseWheel>", self._on_wheel)  # Windows / macOS
+        self.listbox.bind("<Button-4>", lambda event: self._scroll_by(-3))  # X11
+        self.listbox.bind("<Button-5>", lambda event: self._scroll_by(3))
+
+    def append(self, tasks):
+        # Only the visible window can be affected by rows added at the end
+        if self.first + self.height > len(self.rows) - len(tasks):
+            self.render()
+        else:
+            self._update_scrollbar()
+
+    def delete(self, index):
+        self.render()
+
+    def delete_many(self, indexes):
+        self.render()
+
+    def update(self, index):
+        if self.first <= index < self.first + self.height:
+            self.render()
+
+    def update_many(self, indexes):
+        if any(self.first <= index < self.first + self.height for index in indexes):
+            self.render()
+
+    def clear(self):
+        self.first = 0
+        self.render()
+
+    def set_rows(self, rows):
+        self.rows = rows
+        self.render()
+
+    def selected_task(self):
+        """Returns the selected Task (IndexError if none is selected)."""
+        return self.rows[self.first + self.listbox.curselection()[0]]
+
+    def selected_tasks(self):
+        """Returns every selected Task among the visible rows (IndexError if none is selected)."""
+        selection = self.listbox.curselection()
+        if not selection:
+            raise IndexError("no task selected")
+        return [self.rows[self.first + row] for row in selection]
+
+    def yview(self, *args):
+        """Scrollbar callback: handles "moveto" and "scroll" commands."""
+        if args[0] == "moveto":
+            self.scroll_to(int(float(args[1]) * len(self.rows)))
+        elif args[0] == "scroll":
+            step = int(args[1])
+            if args[2] == "pages":
+                step *= self.height
+            self._scroll_by(step)
+
+    def scroll_to(self, first):
+        self.first = first
+        self.render()
+
+    def render(self):
+        """Re-fills the visible rows from `rows`."""
+        self.first = max(0, min(self.first, len(self.rows) - self.height))
+        visible = self.rows[self.first:self.first + self.height]
+        self.listbox.delete(0, tk.END)
+        if visible:
+            self.listbox.insert(tk.END, *[task.label() for task in visible])
+        for row, task in enumerate(visible):
+            if task.done:
+                self.listbox.itemconfig(row, {'fg': DONE_COLOR})
+        self._update_scrollbar()
+
+    # --- Internals ---
+    def _scroll_by(self, step):
+        self.scroll_to(self.first + step)
+        return "break"
+
+    def _on_wheel(self, event):
+        return self._scroll_by(-1 if event.delta > 0 else 1)
+
+    def _update_scrollbar(self):
+        total = len(self.rows)
+        if total <= self.height:
+            self.scrollbar.set(0.0, 1.0)
+        else:
+            self.scrollbar.set(self.first / total, min(1.0, (self.first + self.height) / total))
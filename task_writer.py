@@ -0,0 +1,148 @@
+import threading
+import time
+
+# --- Configuration ---
+COALESCE_DELAY = 0.05  # Seconds the writer waits for the rest of a burst before writing
+RETRY_DELAY = 0.1  # Seconds before retrying a failed write; doubles per failure
+RETRY_MAX_DELAY = 5.0  # Longest wait between retries
+
+def coalesce(records):
+    """Drops records that a later "clear" in the same batch makes irrelevant."""
+    for i in range(len(records) - 1, -1, -1):
+        if records[i][0] == "clear":
+            return records[i:]
+    return records
+
+
+class BackgroundWriter:
+    """Hands edit records to a storage backend on a worker thread.
+
+    `append()` only queues the records and returns, so Tk handlers never
+    wait on disk. The worker waits `delay` seconds for the rest of a burst,
+    then passes everything queued to one `storage.append()` call, which is
+    one write and one fsync for TaskJournal and one transaction for
+    TaskDatabase. Records keep their order. If a write fails, the batch goes
+    back to the front of the queue and the worker retries it with a growing
+    delay; `flush()` and `close()` retry at once and raise the error on the
+    caller's thread if that attempt fails too. Nothing is dropped unless
+    `discard()` is called.
+    """
+
+    def __init__(self, storage, delay=COALESCE_DELAY):
+        self.storage = storage
+        self.delay = delay
+        self.writes = 0
+        self.records_written = 0
+        self.failures = 0  # Failed writes in a row
+        self._pending = []
+        self._busy = False
+        self._flushing = False
+        self._closed = False
+        self._retry_now = False
+        self._error = None
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="task-writer", daemon=True)
+        self._thread.start()
+
+    def append(self, records):
+        """Queues records for writing; returns immediately."""
+        with self._cond:
+            self._pending.extend(records)
+            self._cond.notify_all()
+
+    def flush(self):
+        """Blocks until every queued record has been written.
+
+        After earlier failures this retries right away; if the retry fails
+        as well its error is raised and the records stay queued.
+        """
+        with self._cond:
+            self._flushing = True
+            self._retry_now = True
+            failures = self.failures
+            self._cond.notify_all()
+            try:
+                while (self._pending or self._busy) and self.failures == failures:
+                    self._cond.wait()
+                error = self._error if self.failures != failures else None
+            finally:
+                self._flushing = False
+                self._retry_now = False
+        if error is not None:
+            raise error
+
+    def close(self):
+        """Writes what's still queued and stops the worker (the storage stays open).
+
+        If the write fails, the error is raised and the writer keeps running
+        (and retrying), so the caller can call close() again or discard().
+        """
+        self.flush()
+        self._stop()
+
+    def discard(self):
+        """Drops everything still queued and stops the worker; returns the number of records dropped."""
+        with self._cond:
+            while self._busy:
+                self._cond.wait()
+            dropped = len(self._pending)
+            self._pending = []
+        self._stop()
+        return dropped
+
+    # --- Worker ---
+    def _stop(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+
+    def _wait(self, seconds, interrupted):
+        """Waits up to `seconds` (lock held), returning early once `interrupted()` is true."""
+        deadline = time.monotonic() + seconds
+        while not (interrupted() or self._closed):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            self._cond.wait(remaining)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                if self.failures:
+                    # Back off before retrying, unless flush() wants a retry now
+                    delay = min(RETRY_MAX_DELAY, RETRY_DELAY * 2 ** (self.failures - 1))
+                    self._wait(delay, lambda: self._retry_now)
+                else:
+                    # Let the rest of the burst queue up, unless someone is waiting on flush()
+                    self._wait(self.delay, lambda: self._flushing)
+                if self._closed or not self._pending:
+                    continue
+                self._retry_now = False
+                batch = coalesce(self._pending)
+                self._pending = []
+                self._busy = True
+
+            error = None
+            try:
+                self.storage.append(batch)
+            except Exception as exc:
+                error = exc
+
+            with self._cond:
+                self._busy = False
+                if error is None:
+                    self.writes += 1
+                    self.records_written += len(batch)
+                    self.failures = 0
+                    self._error = None
+                else:
+                    # Keep the records at the front of the queue for the next attempt
+                    self._pending[:0] = batch
+                    self.failures += 1
+                    self._error = error
+                self._cond.notify_all()
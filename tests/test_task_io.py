@@ -0,0 +1,70 @@
+"""Round-trip tests for importing tasks into the text backend.
+
+Run from the repository root:  python -m pytest tests
+"""
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from task_io import import_tasks
+from task_journal import TaskJournal
+
+
+def labels(store):
+    return [(task.text, task.done) for task in store]
+
+
+class ImportRoundTripTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, "tasks.txt")
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def import_and_reload(self, name, content):
+        """Imports a file, compacts the journal into tasks.txt and loads it again."""
+        source = os.path.join(self.dir, name)
+        with open(source, "w", encoding="utf-8", newline="") as file:
+            file.write(content)
+        journal = TaskJournal(self.path, threshold=1)  # Every append triggers a compaction
+        store = journal.load()
+        _, records = import_tasks(source, store)
+        journal.append(records)
+        journal.close()
+        self.assertFalse(os.path.exists(journal.frozen_path))
+
+        journal = TaskJournal(self.path)
+        reloaded = journal.load()
+        journal.close()
+        return store, reloaded
+
+    def test_csv_with_line_breaks_and_markers(self):
+        store, reloaded = self.import_and_reload("tasks.csv", (
+            'text,done\r\n'
+            '"first\nsecond",0\r\n'
+            '"carriage\r\nreturn",1\r\n'
+            'looks done [DONE],0\r\n'
+            'plain,0\r\n'
+        ))
+        self.assertEqual(labels(store), [
+            ("first second", False), ("carriage return", True), ("looks done", True), ("plain", False),
+        ])
+        self.assertEqual(labels(reloaded), labels(store))
+
+    def test_jsonl_with_line_breaks(self):
+        store, reloaded = self.import_and_reload("tasks.jsonl", (
+            '"one\\ntwo"\n'
+            '{"text": "three\\r\\nfour", "done": true}\n'
+            '{"text": "\\n[DONE]"}\n'
+        ))
+        self.assertEqual(labels(store), [("one two", False), ("three four", True)])
+        self.assertEqual(labels(reloaded), labels(store))
+
+
+if __name__ == "__main__":
+    unittest.main()
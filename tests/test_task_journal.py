@@ -0,0 +1,104 @@
+"""Crash-recovery tests for TaskJournal.
+
+Run from the repository root:  python -m pytest tests
+"""
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from task_journal import TaskJournal
+
+
+def texts(store):
+    return [task.text for task in store]
+
+
+class TaskJournalCrashTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, "tasks.txt")
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def open_journal(self):
+        journal = TaskJournal(self.path, threshold=1 << 30)
+        return journal, journal.load()
+
+    def test_torn_tail_is_dropped_before_new_appends(self):
+        journal, _ = self.open_journal()
+        journal.append([["add", "a", 1.0, 1], ["add", "b", 1.0, 2]])
+        journal.close()
+        with open(journal.journal_path, "ab") as file:
+            file.write(b'["add","c')  # Crash halfway through a record
+
+        journal, store = self.open_journal()
+        self.assertEqual(texts(store), ["a", "b"])
+        journal.append([["add", "d", 2.0, 3]])
+        journal.close()
+
+        journal, store = self.open_journal()
+        self.assertEqual(texts(store), ["a", "b", "d"])
+        journal.close()
+
+    def test_record_without_newline_counts_as_torn(self):
+        journal, _ = self.open_journal()
+        journal.append([["add", "a", 1.0, 1]])
+        journal.close()
+        with open(journal.journal_path, "ab") as file:
+            file.write(b'["clear"]')  # Parses, but the newline never made it
+
+        journal, store = self.open_journal()
+        journal.append([["add", "b", 2.0, 2]])
+        journal.close()
+
+        journal, store = self.open_journal()
+        self.assertEqual(texts(store), ["a", "b"])
+        journal.close()
+
+    def freeze(self, journal):
+        """Seals and renames the active journal, then "crashes" before compacting."""
+        with journal._lock:
+            journal._freeze()
+            journal._file.close()
+            journal._file = None
+
+    def test_crash_between_rename_and_compaction(self):
+        journal, _ = self.open_journal()
+        journal.append([["add", "a", 1.0, 1], ["add", "b", 1.0, 2]])
+        self.freeze(journal)
+        self.assertTrue(os.path.exists(journal.frozen_path))
+
+        # The frozen journal is replayed once and folded into the snapshot
+        journal, store = self.open_journal()
+        self.assertEqual(texts(store), ["a", "b"])
+        journal.append([["add", "c", 2.0, 3]])
+        journal.close()
+        self.assertFalse(os.path.exists(journal.frozen_path))
+
+        journal, store = self.open_journal()
+        self.assertEqual(texts(store), ["a", "b", "c"])
+        journal.close()
+
+    def test_crash_after_compaction_before_cleanup(self):
+        journal, _ = self.open_journal()
+        journal.append([["add", "a", 1.0, 1], ["add", "b", 1.0, 2]])
+        self.freeze(journal)
+        saved = journal.frozen_path + ".saved"
+        shutil.copy(journal.frozen_path, saved)
+        journal._compact()
+        # The snapshot was replaced, but the frozen journal survived the crash
+        os.replace(saved, journal.frozen_path)
+
+        journal, store = self.open_journal()
+        journal.close()
+        self.assertEqual(texts(store), ["a", "b"])
+        self.assertFalse(os.path.exists(journal.frozen_path))
+
+
+if __name__ == "__main__":
+    unittest.main()
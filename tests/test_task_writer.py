@@ -0,0 +1,131 @@
+"""Failure-handling tests for BackgroundWriter.
+
+Run from the repository root:  python -m pytest tests
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from task_journal import TaskJournal
+from task_writer import BackgroundWriter
+
+
+class FlakyStorage:
+    """Fails the first `failures` appends with OSError, then stores records."""
+
+    def __init__(self, failures):
+        self.failures = failures
+        self.records = []
+
+    def append(self, records):
+        if self.failures:
+            self.failures -= 1
+            raise OSError("disk unavailable")
+        self.records.extend(records)
+
+
+class BackgroundWriterFailureTest(unittest.TestCase):
+    def test_transient_failure_is_retried(self):
+        storage = FlakyStorage(1)
+        writer = BackgroundWriter(storage, delay=0.01)
+        writer.append([["add", "a", 0.0, 1]])
+        time.sleep(0.05)
+        writer.append([["add", str(i), 0.0, i + 2] for i in range(5)])
+        writer.close()
+        self.assertEqual(len(storage.records), 6)
+
+    def test_close_raises_and_keeps_records_until_discarded(self):
+        storage = FlakyStorage(2)
+        writer = BackgroundWriter(storage, delay=0.01)
+        writer.append([["clear"], ["add", "a", 0.0, 1]])
+        with self.assertRaises(OSError):
+            writer.close()
+        with self.assertRaises(OSError):
+            writer.close()
+        writer.close()  # Third attempt succeeds
+        self.assertEqual(storage.records, [["clear"], ["add", "a", 0.0, 1]])
+
+    def test_discard_drops_queued_records(self):
+        storage = FlakyStorage(100)
+        writer = BackgroundWriter(storage, delay=0.01)
+        writer.append([["add", "a", 0.0, 1]])
+        with self.assertRaises(OSError):
+            writer.close()
+        self.assertEqual(writer.discard(), 1)
+        self.assertEqual(storage.records, [])
+
+
+class ShortWriteFile:
+    """Wraps the journal file so the next write stores half its data, then fails."""
+
+    def __init__(self, file):
+        self.file = file
+
+    def write(self, data):
+        self.file.write(data[:len(data) // 2])
+        self.file.flush()
+        raise OSError("disk full")
+
+    def __getattr__(self, name):
+        return getattr(self.file, name)
+
+
+class BackgroundWriterJournalTest(unittest.TestCase):
+    """Retries against a real TaskJournal, whose failed appends can leave bytes behind."""
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, "tasks.txt")
+        self.journal = TaskJournal(self.path)
+        self.journal.load()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def reload(self):
+        journal = TaskJournal(self.path)
+        store = journal.load()
+        journal.close()
+        return [task.text for task in store]
+
+    def test_retry_after_failed_fsync_writes_records_once(self):
+        writer = BackgroundWriter(self.journal, delay=0.01)
+        writer.append([["add", "a", 0.0, 1], ["add", "b", 0.0, 2]])
+        real_fsync = os.fsync
+        calls = []
+
+        def flaky_fsync(fd):
+            calls.append(fd)
+            if len(calls) == 1:
+                raise OSError("fsync failed")
+            real_fsync(fd)
+
+        with mock.patch("task_journal.os.fsync", flaky_fsync):
+            with self.assertRaises(OSError):
+                writer.close()
+            writer.close()
+        self.journal.close()
+        self.assertEqual(self.reload(), ["a", "b"])
+
+    def test_retry_after_short_write_leaves_no_torn_line(self):
+        writer = BackgroundWriter(self.journal, delay=0.01)
+        writer.append([["add", "a", 0.0, 1]])
+        writer.flush()
+        self.journal._file = ShortWriteFile(self.journal._file)
+        writer.append([["add", "b", 0.0, 2], ["add", "c", 0.0, 3]])
+        with self.assertRaises(OSError):
+            writer.flush()
+        writer.append([["add", "d", 0.0, 4]])
+        writer.close()
+        self.journal.close()
+        self.assertEqual(self.reload(), ["a", "b", "c", "d"])
+
+
+if __name__ == "__main__":
+    unittest.main()
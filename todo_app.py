@@ -1,129 +1,362 @@
 import tkinter as tk
-from tkinter import messagebox
+from tkinter import filedialog, messagebox
 import os
+from concurrent.futures import ThreadPoolExecutor
+from instrumentation import instrument, timed, watch_tk
+from task_db import TaskDatabase
+from task_io import export_tasks, import_tasks
+from task_journal import TaskJournal, replay
+from task_search import TrigramIndex
+from task_store import TaskStore
+from task_view import TaskListView, VirtualTaskListView
+from task_writer import BackgroundWriter
 
 # --- Configuration ---
 FILE_NAME = "tasks.txt"
+DB_NAME = "tasks.db"
+STORAGE = "text"  # "text" (FILE_NAME plus a journal) or "sqlite" (DB_NAME, migrated from FILE_NAME once)
+VIEW_MODE = "auto"  # "full", "virtual", or "auto" (virtual once FILE_NAME gets large)
+VIRTUAL_VIEW_THRESHOLD = 1024 * 1024  # File size in bytes where "auto" switches to virtual
+LOAD_BATCH_DELAY = 1  # Milliseconds between streamed load batches
+FILTER_DELAY = 150  # Milliseconds of typing pause before the filter runs
+FILTER_POLL = 5  # Milliseconds between checks for a finished search
+TRANSFER_FILE_TYPES = [("CSV", "*.csv"), ("JSON Lines", "*.jsonl *.ndjson")]
+
+# The store holds the tasks; the listbox is only a view over it.
+# Widgets and storage are created by main(), so importing this module
+# doesn't open a window or touch the disk.
+store = TaskStore()
+storage = None
+writer = None  # Persists edits on a background thread (see task_writer.py)
+
+# Search index over task text. Index updates and searches all run, in order,
+# on one worker thread, so a search always sees the edits made before it.
+# Both are created per window by build_window(), since on_close() shuts the pool down.
+search_index = TrigramIndex()
+search_pool = None
+filter_query = ""  # Filter currently applied to the view
+filter_job = None  # Pending debounce timer
+filter_search = None  # (query, future) of the newest search
 
 # --- Functions ---
+def open_storage():
+    """Opens the configured storage backend."""
+    # Each edit is appended to a journal next to FILE_NAME (or written to SQLite)
+    # instead of rewriting the whole file
+    if STORAGE == "sqlite":
+        return TaskDatabase(DB_NAME, text_path=FILE_NAME)
+    return TaskJournal(FILE_NAME)
+
+def use_virtual_view():
+    """Decides whether to build rows only for visible tasks."""
+    if VIEW_MODE == "auto":
+        path = DB_NAME if STORAGE == "sqlite" else FILE_NAME
+        return os.path.exists(path) and os.path.getsize(path) > VIRTUAL_VIEW_THRESHOLD
+    return VIEW_MODE == "virtual"
+
+def set_buttons_state(state):
+    for widget in (add_btn, done_btn, delete_btn, clear_btn, import_btn, export_btn, pending_check, filter_entry):
+        widget.config(state=state)
+
+def update_counts():
+    """Shows how many tasks are done and pending (both O(1) on the store)."""
+    count_label.config(text=f"{store.count_done()} done, {store.count_pending()} pending")
+
+def index_tasks(update, *args):
+    """Queues a search index update (e.g. search_index.add) behind earlier ones."""
+    search_pool.submit(update, *args)
+
+def refresh_view(row_update=None):
+    """Applies a single-row update, or rebuilds the rows while the list is filtered."""
+    if filter_query:
+        # Re-run the search; it is queued behind the edit's index update
+        start_filter()
+    elif pending_only.get():
+        task_view.set_rows(store.pending())
+    elif row_update is not None:
+        row_update()
+    else:
+        task_view.set_rows(store)
+    update_counts()
+
+@instrument("todo.filter_key")
+def on_filter_key(event=None):
+    """Debounces typing in the filter box: only the last keystroke's text is searched."""
+    global filter_job
+    if filter_job is not None:
+        root.after_cancel(filter_job)
+    filter_job = root.after(FILTER_DELAY, start_filter)
+
+def start_filter():
+    """Starts a search for the filter box text on the search thread."""
+    global filter_job, filter_query, filter_search
+    filter_job = None
+    query = filter_entry.get().strip()
+    if not query:
+        filter_query = ""
+        filter_search = None
+        refresh_view()
+        return
+    filter_search = (query, search_pool.submit(search_index.search, query))
+    poll_filter(filter_search)
+
+def poll_filter(search):
+    """Shows a finished search's matches, unless a newer search replaced it."""
+    global filter_query
+    if search is not filter_search:
+        return
+    query, future = search
+    if not future.done():
+        root.after(FILTER_POLL, poll_filter, search)
+        return
+    filter_query = query
+    matches = future.result()
+    task_view.set_rows([task for task in matches if not task.done] if pending_only.get() else matches)
+    update_counts()
+
+def selected_indexes():
+    """Returns the store positions of the selected tasks (IndexError if none is selected).
+
+    While a filter result is catching up with an edit, the view can still
+    show tasks that were just deleted; those are skipped.
+    """
+    return [store.index_of(task.id) for task in task_view.selected_tasks() if store.get(task.id) is task]
+
 def load_tasks():
-    """Loads tasks from the text file into the listbox."""
-    if os.path.exists(FILE_NAME):
-        with open(FILE_NAME, "r") as file:
-            tasks = file.readlines()
-            for task in tasks:
-                task_listbox.insert(tk.END, task.strip())
-                # If a task was marked as done previously, make it gray
-                if task.strip().endswith("[DONE]"):
-                    task_listbox.itemconfig(tk.END, {'fg': 'gray'})
-
-def save_tasks():
-    """Saves the current tasks in the listbox to the text file."""
-    tasks = task_listbox.get(0, tk.END)
-    with open(FILE_NAME, "w") as file:
-        for task in tasks:
-            file.write(task + "\n")
+    """Streams tasks from the text file into the listbox without blocking startup."""
+    set_buttons_state(tk.DISABLED)
+    root.after(0, load_next_batch, storage.stream(store))
+
+def load_next_batch(batches):
+    """Shows one streamed batch of tasks, then schedules the next one."""
+    try:
+        batch = next(batches)
+    except StopIteration:
+        finish_loading()
+        return
+    task_view.append(batch)
+    index_tasks(search_index.add, batch)
+    update_counts()
+    root.after(LOAD_BATCH_DELAY, load_next_batch, batches)
+
+def finish_loading():
+    """Replays the journal on top of the streamed snapshot and enables editing."""
+    records = storage.pending_records()
+    if records:
+        replay(store, records)
+        index_tasks(search_index.rebuild, list(store))
+        refresh_view()
+    set_buttons_state(tk.NORMAL)
+
+def on_close():
+    """Writes queued edits and finishes any pending compaction before the window closes."""
+    while True:
+        try:
+            writer.close()
+            break
+        except Exception as error:
+            if messagebox.askretrycancel("Error", f"Could not save the last changes:\n{error}"):
+                continue
+            if not messagebox.askyesno("Discard changes", "Close without saving the last changes?"):
+                return  # Keep the window open; the writer keeps retrying in the background
+            writer.discard()
+            break
+    storage.close()
+    search_pool.shutdown(wait=False, cancel_futures=True)
+    root.destroy()
 
+@instrument("todo.add_task")
 def add_task():
     """Gets the task from the entry box and adds it to the list."""
     task_text = task_entry.get()
     if task_text.strip() != "":
-        task_listbox.insert(tk.END, task_text)
-        task_entry.delete(0, tk.END) # Clear the input field
-        save_tasks()
+        with timed("todo.add_task.work"):
+            task = store.add(task_text)
+            index_tasks(search_index.add, [task])
+            refresh_view(lambda: task_view.append([task]))
+            task_entry.delete(0, tk.END) # Clear the input field
+            writer.append([["add", task.text, task.created, task.id]])
     else:
         messagebox.showwarning("Warning", "Please enter a task first!")
 
+@instrument("todo.delete_task")
 def delete_task():
-    """Deletes the selected task from the list."""
+    """Deletes the selected tasks from the list (one refresh and one write for all of them)."""
     try:
-        selected_task_index = task_listbox.curselection()[0]
-        task_listbox.delete(selected_task_index)
-        save_tasks()
+        with timed("todo.delete_task.work"):
+            indexes = selected_indexes()
+            removed = store.delete_many(indexes)
+            index_tasks(search_index.remove, removed)
+            refresh_view(lambda: task_view.delete_many(indexes))
+            # Highest position first, so each journal index is still valid when replayed
+            writer.append([["del", index, task.id] for index, task in reversed(list(zip(indexes, removed)))])
     except IndexError:
         messagebox.showwarning("Warning", "Please select a task to delete!")
 
+@instrument("todo.mark_done")
 def mark_done():
-    """Marks the selected task as completed."""
+    """Marks the selected tasks as completed."""
     try:
-        selected_task_index = task_listbox.curselection()[0]
-        task_text = task_listbox.get(selected_task_index)
-        
-        # Check if it's already marked as done
-        if not task_text.endswith("[DONE]"):
-            # Update the text and color
-            updated_text = task_text + " [DONE]"
-            task_listbox.delete(selected_task_index)
-            task_listbox.insert(selected_task_index, updated_text)
-            task_listbox.itemconfig(selected_task_index, {'fg': 'gray'})
-            save_tasks()
+        with timed("todo.mark_done.work"):
+            indexes = selected_indexes()
+            
+            # Only pending tasks change (and turn gray)
+            changed = store.mark_done_many(indexes)
+            if changed:
+                refresh_view(lambda: task_view.update_many(changed))
+                writer.append([["done", index, store[index].updated, store[index].id] for index in changed])
     except IndexError:
         messagebox.showwarning("Warning", "Please select a task to mark as done!")
 
+@instrument("todo.clear_all")
 def clear_all():
     """Clears all tasks from the list."""
     confirm = messagebox.askyesno("Confirm", "Are you sure you want to delete all tasks?")
     if confirm:
-        task_listbox.delete(0, tk.END)
-        save_tasks()
+        with timed("todo.clear_all.work"):
+            store.clear()
+            index_tasks(search_index.clear)
+            refresh_view(task_view.clear)
+            writer.append([["clear"]])
+
+@instrument("todo.import_file")
+def import_file():
+    """Appends the tasks from a CSV or JSON Lines file."""
+    path = filedialog.askopenfilename(title="Import tasks", filetypes=TRANSFER_FILE_TYPES)
+    if not path:
+        return
+    try:
+        with timed("todo.import_file.work"):
+            tasks, records = import_tasks(path, store)
+            index_tasks(search_index.add, tasks)
+            refresh_view(lambda: task_view.append(tasks))
+            writer.append(records)
+    except (OSError, ValueError) as error:
+        messagebox.showerror("Import failed", str(error))
+
+@instrument("todo.export_file")
+def export_file():
+    """Writes every task to a CSV or JSON Lines file."""
+    path = filedialog.asksaveasfilename(title="Export tasks", filetypes=TRANSFER_FILE_TYPES, defaultextension=".csv")
+    if not path:
+        return
+    try:
+        export_tasks(path, store)
+    except (OSError, ValueError) as error:
+        messagebox.showerror("Export failed", str(error))
 
 # --- Main UI Setup ---
-# Create the main window
-root = tk.Tk()
-root.title("To-Do List Manager")
-root.geometry("400x500")
-root.config(bg="#f4f4f4")
-root.resizable(False, False)
-
-# --- UI Widgets ---
-# Title Label
-title_label = tk.Label(root, text="My To-Do List", font=("Helvetica", 18, "bold"), bg="#f4f4f4")
-title_label.pack(pady=15)
-
-# Input Field (Entry)
-task_entry = tk.Entry(root, font=("Helvetica", 14), width=25)
-task_entry.pack(pady=10)
-
-# Frame for Listbox and Scrollbar
-list_frame = tk.Frame(root)
-list_frame.pack(pady=10)
-
-# Scrollbar
-scrollbar = tk.Scrollbar(list_frame)
-scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-
-# Listbox (The table/list of tasks)
-task_listbox = tk.Listbox(
-    list_frame, 
-    width=35, 
-    height=10, 
-    font=("Helvetica", 12),
-    selectbackground="#a6a6a6",
-    yscrollcommand=scrollbar.set
-)
-task_listbox.pack(side=tk.LEFT, fill=tk.BOTH)
-scrollbar.config(command=task_listbox.yview)
-
-# Frame for Buttons
-button_frame = tk.Frame(root, bg="#f4f4f4")
-button_frame.pack(pady=10)
-
-# Buttons
-add_btn = tk.Button(button_frame, text="Add Task", font=("Helvetica", 10), bg="#4caf50", fg="white", width=12, command=add_task)
-add_btn.grid(row=0, column=0, padx=5, pady=5)
-
-done_btn = tk.Button(button_frame, text="Mark Done", font=("Helvetica", 10), bg="#2196f3", fg="white", width=12, command=mark_done)
-done_btn.grid(row=0, column=1, padx=5, pady=5)
-
-delete_btn = tk.Button(button_frame, text="Delete Task", font=("Helvetica", 10), bg="#f44336", fg="white", width=12, command=delete_task)
-delete_btn.grid(row=1, column=0, padx=5, pady=5)
-
-clear_btn = tk.Button(button_frame, text="Clear All", font=("Helvetica", 10), bg="#ff9800", fg="white", width=12, command=clear_all)
-clear_btn.grid(row=1, column=1, padx=5, pady=5)
-
-# --- Startup Action ---
-# Load existing tasks when the app starts
-load_tasks()
-
-# Run the application
-root.mainloop()
\ No newline at end of file
+def build_window():
+    """Builds the window, starts loading the tasks and returns the Tk root."""
+    global storage, writer, root, task_entry, task_listbox, task_view, pending_only, count_label
+    global pending_check, add_btn, done_btn, delete_btn, clear_btn, import_btn, export_btn, filter_entry
+    global search_index, search_pool, filter_query, filter_job, filter_search
+
+    storage = open_storage()
+    writer = BackgroundWriter(storage)
+    search_index = TrigramIndex()
+    search_pool = ThreadPoolExecutor(max_workers=1)
+    filter_query, filter_job, filter_search = "", None, None
+
+    # Create the main window
+    root = tk.Tk()
+    root.title("To-Do List Manager")
+    root.geometry("400x575")
+    root.config(bg="#f4f4f4")
+    root.resizable(False, False)
+
+    # --- UI Widgets ---
+    # Title Label
+    title_label = tk.Label(root, text="My To-Do List", font=("Helvetica", 18, "bold"), bg="#f4f4f4")
+    title_label.pack(pady=15)
+
+    # Input Field (Entry)
+    task_entry = tk.Entry(root, font=("Helvetica", 14), width=25)
+    task_entry.pack(pady=10)
+
+    # Filter box: narrows the list as you type (searched through the trigram index)
+    search_frame = tk.Frame(root, bg="#f4f4f4")
+    search_frame.pack()
+
+    filter_label = tk.Label(search_frame, text="Filter:", font=("Helvetica", 10), bg="#f4f4f4")
+    filter_label.pack(side=tk.LEFT, padx=5)
+
+    filter_entry = tk.Entry(search_frame, font=("Helvetica", 11), width=28)
+    filter_entry.pack(side=tk.LEFT)
+    filter_entry.bind("<KeyRelease>", on_filter_key)
+
+    # Frame for Listbox and Scrollbar
+    list_frame = tk.Frame(root)
+    list_frame.pack(pady=10)
+
+    # Scrollbar
+    scrollbar = tk.Scrollbar(list_frame)
+    scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+    # Listbox (The table/list of tasks)
+    task_listbox = tk.Listbox(
+        list_frame, 
+        width=35, 
+        height=10, 
+        font=("Helvetica", 12),
+        selectbackground="#a6a6a6",
+        selectmode=tk.EXTENDED,  # Shift/Ctrl-click to mark or delete several tasks at once
+        yscrollcommand=scrollbar.set
+    )
+    task_listbox.pack(side=tk.LEFT, fill=tk.BOTH)
+    scrollbar.config(command=task_listbox.yview)
+
+    # Large task files get a virtual view that only fills the visible rows
+    if use_virtual_view():
+        task_view = VirtualTaskListView(task_listbox, scrollbar, store)
+    else:
+        task_view = TaskListView(task_listbox, store)
+
+    # Filter and counts, both answered from the store's status index
+    filter_frame = tk.Frame(root, bg="#f4f4f4")
+    filter_frame.pack()
+
+    pending_only = tk.BooleanVar(value=False)
+    pending_check = tk.Checkbutton(filter_frame, text="Pending only", variable=pending_only, bg="#f4f4f4", command=refresh_view)
+    pending_check.pack(side=tk.LEFT, padx=5)
+
+    count_label = tk.Label(filter_frame, text="", font=("Helvetica", 10), bg="#f4f4f4", fg="gray")
+    count_label.pack(side=tk.LEFT, padx=5)
+
+    # Frame for Buttons
+    button_frame = tk.Frame(root, bg="#f4f4f4")
+    button_frame.pack(pady=10)
+
+    # Buttons
+    add_btn = tk.Button(button_frame, text="Add Task", font=("Helvetica", 10), bg="#4caf50", fg="white", width=12, command=add_task)
+    add_btn.grid(row=0, column=0, padx=5, pady=5)
+
+    done_btn = tk.Button(button_frame, text="Mark Done", font=("Helvetica", 10), bg="#2196f3", fg="white", width=12, command=mark_done)
+    done_btn.grid(row=0, column=1, padx=5, pady=5)
+
+    delete_btn = tk.Button(button_frame, text="Delete Task", font=("Helvetica", 10), bg="#f44336", fg="white", width=12, command=delete_task)
+    delete_btn.grid(row=1, column=0, padx=5, pady=5)
+
+    clear_btn = tk.Button(button_frame, text="Clear All", font=("Helvetica", 10), bg="#ff9800", fg="white", width=12, command=clear_all)
+    clear_btn.grid(row=1, column=1, padx=5, pady=5)
+
+    import_btn = tk.Button(button_frame, text="Import...", font=("Helvetica", 10), width=12, command=import_file)
+    import_btn.grid(row=2, column=0, padx=5, pady=5)
+
+    export_btn = tk.Button(button_frame, text="Export...", font=("Helvetica", 10), width=12, command=export_file)
+    export_btn.grid(row=2, column=1, padx=5, pady=5)
+
+    # --- Startup Action ---
+    # Load existing tasks when the app starts (the window shows up right away)
+    load_tasks()
+    root.protocol("WM_DELETE_WINDOW", on_close)
+    watch_tk(root)
+    return root
+
+def main():
+    """Builds the window and runs the Tk event loop."""
+    build_window().mainloop()
+
+
+if __name__ == '__main__':
+    main()